@@ -31,32 +31,389 @@ AI对话视图系统 - AIView/AIWebView
 - 2025-04-15 初版多AI容器支持
 """
 
-from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel, QSplitter, QComboBox, QPushButton, QApplication, QDialog, QListWidget, QListWidgetItem, QTextEdit, QDialogButtonBox, QFrame, QSizePolicy
-from PyQt6.QtCore import Qt, QUrl, QFile, QIODevice, QTimer, QSize
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel, QSplitter, QComboBox, QPushButton, QApplication, QDialog, QListView, QStyledItemDelegate, QStyle, QTextEdit, QDialogButtonBox, QFrame
+from PyQt6.QtCore import Qt, QUrl, QFile, QIODevice, QTimer, QSize, QRect, QSignalBlocker
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineSettings, QWebEngineScript
-from PyQt6.QtGui import QPixmap, QIcon
+from PyQt6.QtGui import QIcon, QColor, QFont, QFontMetrics, QStandardItemModel, QStandardItem
 import os
 import qtawesome as qta
 import sys
+import re
 import logging
 import json
-from PyQt6.QtCore import pyqtSlot, QObject
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from PyQt6.QtCore import pyqtSlot, pyqtSignal, QObject
 
 from app.config import SUPPORTED_AI_PLATFORMS
 from app.controllers.web_profile_manager import WebProfileManager
 from app.controllers.settings_manager import SettingsManager
 from app.controllers.theme_manager import ThemeManager
 
+# app包目录，图标和脚本路径都由它推导
+_APP_DIR = os.path.dirname(os.path.dirname(__file__))
+
 # 图标文件夹路径 - 考虑打包环境和开发环境
-ICON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "icons")
+ICON_DIR = os.path.join(os.path.dirname(_APP_DIR), "icons")
 if not os.path.exists(ICON_DIR) and getattr(sys, 'frozen', False):
     # 打包环境下可能路径不同，尝试相对于可执行文件的路径
     base_dir = os.path.dirname(sys.executable)
     ICON_DIR = os.path.join(base_dir, "icons")
 
+def _scan_icon_dir():
+    """扫描一次图标文件夹，建立 平台key(小写) -> 图标路径 的映射，同名时png优先于ico"""
+    icon_paths = {}
+    try:
+        # scandir一次取得文件名和类型，无需再逐个stat判断是否为文件
+        with os.scandir(ICON_DIR) as entries:
+            names = sorted(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        return icon_paths
+    for ext in ('.png', '.ico'):
+        for name in names:
+            stem, file_ext = os.path.splitext(name)
+            if file_ext.lower() == ext:
+                icon_paths.setdefault(stem.lower(), os.path.join(ICON_DIR, name))
+    return icon_paths
+
+# 本地平台图标路径，模块加载时扫描一次，避免逐个平台探测文件是否存在
+_ICON_PATHS = _scan_icon_dir()
+
 # 注入脚本路径
-INJECTOR_SCRIPT_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "static", "js", "prompt_injector.js")
+_JS_DIR = os.path.join(_APP_DIR, "static", "js")
+INJECTOR_SCRIPT_PATH = os.path.join(_JS_DIR, "prompt_injector.js")
+
+# 每次文档加载时按顺序执行的页面脚本：rangy高亮依赖库，最后是提示词注入脚本
+PAGE_SCRIPT_PATHS = (
+    os.path.join(_JS_DIR, "rangy-core.min.js"),
+    os.path.join(_JS_DIR, "rangy-classapplier.min.js"),
+    os.path.join(_JS_DIR, "rangy-highlighter.min.js"),
+    INJECTOR_SCRIPT_PATH,
+)
+
+# 注入脚本之后执行的备用通信增强：高亮数据改走LocalStorage保存
+_FALLBACK_HIGHLIGHT_SCRIPT = """
+// 添加备用高亮功能
+if (typeof saveHighlightToPython === 'function') {
+    const originalSaveHighlight = saveHighlightToPython;
+    saveHighlightToPython = function(highlightData) {
+        try {
+            // 直接使用备用方式保存
+            if (window.AiSparkHub && window.AiSparkHub.fallbackHighlight) {
+                window.AiSparkHub.fallbackHighlight(highlightData);
+                return true;
+            }
+        } catch(e) {
+            console.error('高亮保存失败:', e);
+        }
+        return false;
+    };
+    console.log('已设置备用高亮保存功能');
+}
+"""
+
+# 前端日志处理器与LocalStorage备用通信函数，需在备用高亮脚本之后执行
+_LOG_HANDLER_SCRIPT = """
+document.addEventListener('aiSendLogToPython', function(event) {
+    try {
+        // 只记录到控制台
+        const logData = JSON.parse(event.detail);
+        console.log('JS日志:', logData);
+    } catch(e) {
+        console.error('处理日志失败:', e);
+    }
+});
+
+// 添加备用通信方式 - 通过LocalStorage
+window.AiSparkHub = window.AiSparkHub || {};
+window.AiSparkHub.fallbackHighlight = function(highlightData) {
+    try {
+        console.log('使用备用方式(LocalStorage)发送高亮数据');
+        // 生成唯一key并存入LocalStorage
+        const key = 'HIGHLIGHT_' + Date.now() + '_' + Math.random().toString(36).substring(2, 10);
+        localStorage.setItem(key, JSON.stringify(highlightData));
+        console.log('高亮数据已保存到LocalStorage，键名:', key);
+        return true;
+    } catch(e) {
+        console.error('备用高亮方式(LocalStorage)失败:', e);
+        // 尝试其他可能的备用机制
+        try {
+            // 特殊格式化，前缀标识这是一个高亮数据
+            const encodedData = 'HIGHLIGHT:' + JSON.stringify(highlightData);
+
+            // 尝试写入剪贴板 (作为最后的备用)
+            if (navigator.clipboard && navigator.clipboard.writeText) {
+                navigator.clipboard.writeText(encodedData)
+                    .then(() => console.log('高亮数据已写入剪贴板(备用方案2)'))
+                    .catch(err => console.error('剪贴板写入失败:', err));
+            } else {
+                console.error('所有备用方案均失败');
+            }
+        } catch(clipboardError) {
+            console.error('所有备用通信方式均失败');
+        }
+        return false;
+    }
+};
+
+// 使直接保存函数使用备用方案
+window.saveHighlightToPython = function(highlightData) {
+    try {
+        // 直接使用备用方式
+        window.AiSparkHub.fallbackHighlight(highlightData);
+        return true;
+    } catch(e) {
+        console.error('保存高亮失败:', e);
+        return false;
+    }
+};
+"""
+
+@lru_cache(maxsize=128)
+def _cached_qta_icon(name, color, badge=None, badge_color=None):
+    """按(图标名, 颜色, 角标, 角标颜色)缓存qtawesome图标，相同图标只渲染一次
+    
+    颜色是缓存键的一部分，主题切换后会自然使用新颜色的图标，无需清空缓存。
+    """
+    if badge:
+        return qta.icon(name, color=color, badge=badge, badge_color=badge_color)
+    return qta.icon(name, color=color)
+
+@lru_cache(maxsize=None)
+def _read_script(path):
+    """读取本地脚本文件内容并缓存，每个文件只读取一次
+    
+    Returns:
+        str: 脚本内容，无法打开文件时返回None
+    """
+    script_file = QFile(path)
+    if not script_file.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text):
+        return None
+    try:
+        return script_file.readAll().data().decode('utf-8')
+    finally:
+        script_file.close()
+
+@lru_cache(maxsize=None)
+def _platform_icon(lowercase_key):
+    """加载平台图标并缓存，优先使用本地图标文件，失败时使用qtawesome图标
+    
+    QIcon是隐式共享的，同一个平台的图标可以被多个下拉框复用。
+    
+    Args:
+        lowercase_key (str): 平台标识
+        
+    Returns:
+        QIcon: 平台图标
+    """
+    logger = logging.getLogger("AiSparkHub.AIView")
+    icon = None
+    
+    # 先尝试加载本地图标文件（png优先，其次ico）
+    icon_path = _ICON_PATHS.get(lowercase_key)
+    
+    if icon_path:
+        # 按文件路径构建图标，图片在下拉列表首次绘制时才解码
+        try:
+            icon = QIcon(icon_path)
+        except Exception as e:
+            logger.warning(f"从{icon_path}加载图标失败: {str(e)}")
+            icon = None  # 加载失败，设为None以便尝试qtawesome
+    else:
+        logger.debug(f"未找到{lowercase_key}的本地图标，尝试使用qtawesome")
+    
+    # 如果本地图标加载失败，尝试使用qtawesome
+    if icon is None:
+        try:
+            # 获取该平台对应的图标名，如果没有指定则使用评论图标
+            icon_name = _PLATFORM_ICON_NAMES.get(lowercase_key, "fa5s.comment")
+            icon = qta.icon(icon_name)
+        except Exception as e:
+            logger.warning(f"使用qtawesome图标失败({lowercase_key}): {str(e)}")
+            # 如果qtawesome也失败，使用默认图标
+            icon = qta.icon("fa5s.comment")
+    
+    return icon
+
+# 高亮列表对话框样式：对话框本身透明无边框，内容框、标题栏和复制按钮按objectName区分
+_HIGHLIGHT_DIALOG_STYLE = """
+    QDialog {
+        background: transparent;
+        border: none;
+    }
+    QFrame {
+        background-color: #FFFFFF;
+        border: 1px solid #E0E0E0;
+        border-radius: 0px;
+    }
+    QWidget#titleContainer {
+        background-color: #F7F7F7;
+        border-top-left-radius: 0px;
+        border-top-right-radius: 0px;
+    }
+    QLabel#titleLabel {
+        background-color: transparent;
+        border: none;
+        color: #000000;
+    }
+    QPushButton#copyButton {
+        border: none;
+        background: transparent;
+        padding: 0px;
+        margin-left: 6px;
+    }
+    QScrollBar:vertical {
+        width: 4px;
+        background: #F5F5F5;
+        margin: 0px 0px 0px 0px;
+        border: none;
+        border-radius: 2px;
+    }
+    QScrollBar::handle:vertical {
+        background: #C0C0C0;
+        min-height: 20px;
+        border-radius: 2px;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        background: none;
+    }
+"""
+
+# 视图标题栏按钮的图标尺寸
+_TITLE_BUTTON_ICON_SIZE = QSize(14, 14)
+
+# 高亮数量缓存的有效期（秒），保存高亮时会立即失效
+HIGHLIGHT_COUNT_TTL = 2.0
+
+# 多个网页视图同时创建时，相邻视图开始加载页面的间隔（毫秒）
+WEB_VIEW_LOAD_STAGGER_MS = 80
+
+# 切换平台后保留的闲置网页视图数量上限，超出时销毁最久未使用的视图
+WEB_VIEW_POOL_SIZE = 3
+
+# 本地图标缺失时各AI平台使用的qtawesome图标
+_PLATFORM_ICON_NAMES = {
+    "chatgpt": "fa5b.chrome",      # ChatGPT使用Chrome图标
+    "kimi": "fa5s.robot",          # Kimi使用机器人图标
+    "doubao": "fa5s.comment",      # 其他平台使用通用对话图标
+    "yuanbao": "fa5s.comment-dots",
+    "perplexity": "fa5s.search",   # Perplexity用搜索图标
+    "metaso": "fa5s.search",       # 元搜索用搜索图标
+    "grok": "fa5b.twitter",        # Grok关联Twitter/X
+    "yiyan": "fa5b.baidu",         # 文心一言用百度图标
+    "gemini": "fa5b.google",       # Gemini用Google图标
+    "tongyi": "fa5b.alipay",       # 通义用阿里图标
+    "chatglm": "fa5s.brain",       # ChatGLM用脑图标
+    "biji": "fa5s.sticky-note",    # 笔记用便签图标
+    "n": "fa5s.yin-yang",          # N用特殊图标
+    "deepseek": "fa5s.power-off"   # DeepSeek用电源图标
+}
+
+# URL域名到平台标识的映射
+_URL_TO_PLATFORM = {
+    'chat.openai.com': 'chatgpt',
+    'chatgpt.com': 'chatgpt',
+    'kimi.moonshot.cn': 'kimi',
+    'doubao.com': 'doubao',
+    'perplexity.ai': 'perplexity',
+    'n.cn': 'n',
+    'metaso.cn': 'metaso',
+    'chatglm.cn': 'chatglm',
+    'yuanbao.tencent.com': 'yuanbao',
+    'biji.com': 'biji',
+    'x.com': 'grok',
+    'grok.com': 'grok',
+    'yiyan.baidu.com': 'yiyan',
+    'tongyi.aliyun.com': 'tongyi',
+    'gemini.google.com': 'gemini',
+    'chat.deepseek.com': 'deepseek',
+    'claude.ai': 'claude',
+    'anthropic.com': 'claude',
+    'bing.com': 'bing'
+}
+
+# 按域名标签倒序(从顶级域名开始)构建的后缀索引，叶子节点的 None 键存放平台标识
+_DOMAIN_SUFFIX_INDEX = {}
+for _host, _platform_key in _URL_TO_PLATFORM.items():
+    _node = _DOMAIN_SUFFIX_INDEX
+    for _label in reversed(_host.split('.')):
+        _node = _node.setdefault(_label, {})
+    _node[None] = _platform_key
+del _host, _platform_key, _node, _label
+
+# 从URL中提取主机名（去掉www.前缀和端口），只需主机名时比完整解析URL更轻量
+_HOST_RE = re.compile(r'^https?://(?:www\.)?([^/:?#]+)', re.IGNORECASE)
+
+# 平台标识(小写key)到平台配置的反向索引，SUPPORTED_AI_PLATFORMS 运行期间不会变化
+_PLATFORM_BY_KEY = {cfg["key"]: cfg for cfg in SUPPORTED_AI_PLATFORMS.values()}
+
+# 平台显示名称到平台配置的索引（名称重复时保留第一个），供旧接口按名称查找
+_PLATFORM_BY_NAME = {cfg["name"]: cfg for cfg in reversed(list(SUPPORTED_AI_PLATFORMS.values()))}
+
+def _match_platform_by_domain(domain):
+    """按域名后缀匹配平台标识，返回最长匹配的平台key，找不到时返回None
+    
+    例如 "www.kimi.moonshot.cn" 与 "kimi.moonshot.cn" 都会匹配到 "kimi"。
+    """
+    node = _DOMAIN_SUFFIX_INDEX
+    matched = None
+    for label in reversed(domain.split('.')):
+        node = node.get(label)
+        if node is None:
+            break
+        matched = node.get(None, matched)
+    return matched
+
+# 高亮类型对应的颜色条颜色
+_HIGHLIGHT_COLOR_MAP = {
+    'yellow': '#FFC107',
+    'green': '#4CAF50',
+    'red': '#F44336',
+    'blue': '#03A9F4',
+    'purple': '#9C27B0',
+    'pink': '#E91E63'
+}
+
+# 预先创建的颜色条QColor，绘制时直接复用
+_HIGHLIGHT_QCOLORS = {name: QColor(color) for name, color in _HIGHLIGHT_COLOR_MAP.items()}
+
+# 高亮文本的绘制/测量标志：左上对齐并自动换行
+_HIGHLIGHT_TEXT_FLAGS = Qt.AlignmentFlag.AlignLeft.value | Qt.AlignmentFlag.AlignTop.value | Qt.TextFlag.TextWordWrap.value
+
+# 网页控制台消息级别(Info/Warning/Error的枚举值)对应的日志级别和显示名称
+_JS_CONSOLE_LEVELS = {
+    0: (logging.DEBUG, "INFO"),
+    1: (logging.WARNING, "WARNING"),
+    2: (logging.ERROR, "ERROR"),
+}
+
+def _resolve_web_attributes(names):
+    """按名称解析QWebEngineSettings属性，跳过当前PyQt6版本不支持的属性"""
+    logger = logging.getLogger("AiSparkHub.AIView")
+    attributes = []
+    for name in names:
+        attribute = getattr(QWebEngineSettings.WebAttribute, name, None)
+        if attribute is None:
+            logger.warning(f"{name}属性不可用")
+        else:
+            attributes.append(attribute)
+    return tuple(attributes)
+
+# 每个AI网页视图都需要启用的页面属性：JavaScript、剪贴板、全屏支持以及本地内容访问
+_ENABLED_WEB_ATTRIBUTES = _resolve_web_attributes((
+    "JavascriptEnabled",
+    "JavascriptCanAccessClipboard",
+    "JavascriptCanPaste",
+    "FullScreenSupportEnabled",
+    "LocalContentCanAccessRemoteUrls",
+    "LocalContentCanAccessFileUrls",
+))
 
 class WebEnginePage(QWebEnginePage):
     """自定义WebEnginePage以捕获网页日志和错误"""
@@ -67,24 +424,15 @@ class WebEnginePage(QWebEnginePage):
         self.view_name = parent.ai_name if hasattr(parent, 'ai_name') else "未知视图"
         
     def javaScriptConsoleMessage(self, level, message, line, source):
-        """接收JavaScript控制台消息"""
-        # 使用数字枚举值替代不存在的常量名称
-        log_level_map = {
-            0: "INFO",      # 对应 InfoMessageLevel
-            1: "WARNING",   # 对应 WarningMessageLevel 
-            2: "ERROR"      # 对应 ErrorMessageLevel
-        }
-        log_level = log_level_map.get(level, "INFO")
-        source_name = os.path.basename(source) if source else "unknown"
-        log_msg = f"[{self.view_name}][JS-{log_level}] {source_name}:{line} - {message}"
+        """接收JavaScript控制台消息
         
-        # 根据级别记录到不同的日志级别
-        if log_level == "ERROR":
-            self.logger.error(log_msg)
-        elif log_level == "WARNING":
-            self.logger.warning(log_msg)
-        else:
-            self.logger.info(log_msg)
+        网页普通console输出非常频繁，按DEBUG级别记录；未开启调试日志时直接返回，不做任何格式化。
+        """
+        log_level, level_name = _JS_CONSOLE_LEVELS.get(getattr(level, 'value', level), _JS_CONSOLE_LEVELS[0])
+        if not self.logger.isEnabledFor(log_level):
+            return
+        source_name = os.path.basename(source) if source else "unknown"
+        self.logger.log(log_level, "[%s][JS-%s] %s:%s - %s", self.view_name, level_name, source_name, line, message)
         
     def certificateError(self, error):
         """捕获证书错误"""
@@ -92,81 +440,131 @@ class WebEnginePage(QWebEnginePage):
         self.logger.error(f"[{self.view_name}] 证书错误: {url} - {error.errorDescription()}")
         return False  # 取消加载
 
+class HighlightItemDelegate(QStyledItemDelegate):
+    """高亮列表项绘制代理
+    
+    直接用QPainter绘制左侧颜色条、文本和底部分割线，避免为每一项创建控件树。
+    行高由调用方预先计算并通过SizeHintRole存入模型，QStyledItemDelegate默认的
+    sizeHint()会直接返回该值。
+    """
+    
+    BAR_WIDTH = 4
+    H_PADDING = 14
+    V_PADDING = 12
+    
+    def __init__(self, font, parent=None):
+        super().__init__(parent)
+        self._font = font
+        self._text_color = QColor('#000000')
+        self._background = QColor('#FFFFFF')
+        self._hover_background = QColor('#F7F7F7')
+        self._separator = QColor('#F0F0F0')
+    
+    def paint(self, painter, option, index):
+        """绘制单个高亮项"""
+        rect = option.rect
+        highlight = index.data(Qt.ItemDataRole.UserRole) or {}
+        bar_color = _HIGHLIGHT_QCOLORS.get(highlight.get('highlight_type'), _HIGHLIGHT_QCOLORS['yellow'])
+        
+        painter.save()
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        painter.fillRect(rect, self._hover_background if hovered else self._background)
+        painter.fillRect(QRect(rect.left(), rect.top(), self.BAR_WIDTH, rect.height()), bar_color)
+        
+        # 除最后一项外绘制底部分割线
+        if index.row() < index.model().rowCount() - 1:
+            painter.fillRect(QRect(rect.left() + self.BAR_WIDTH, rect.bottom(), rect.width() - self.BAR_WIDTH, 1), self._separator)
+        
+        text_rect = rect.adjusted(self.BAR_WIDTH + self.H_PADDING, self.V_PADDING, -self.H_PADDING, -self.V_PADDING)
+        painter.setFont(self._font)
+        painter.setPen(self._text_color)
+        painter.drawText(text_rect, _HIGHLIGHT_TEXT_FLAGS, index.data(Qt.ItemDataRole.DisplayRole) or '')
+        painter.restore()
+
+# 提示词注入调用的固定前后缀，中间拼接JSON编码后的提示词
+_INJECT_PROMPT_PREFIX = "window.AiSparkHub.injectPrompt("
+_INJECT_PROMPT_SUFFIX = ")"
+
+def build_inject_prompt_script(prompt_text):
+    """构建调用注入函数的脚本，json.dumps一次完成JS字符串字面量的转义
+    
+    Args:
+        prompt_text (str): 提示词文本
+        
+    Returns:
+        str: 可直接交给runJavaScript执行的脚本
+    """
+    # 保留非ASCII字符原样输出，中文提示词不再膨胀为\uXXXX转义序列
+    return _INJECT_PROMPT_PREFIX + json.dumps(prompt_text, ensure_ascii=False) + _INJECT_PROMPT_SUFFIX
+
 class AIWebView(QWebEngineView):
     """单个AI网页视图"""
     
-    def __init__(self, ai_config):
+    # 高亮数据保存成功后发出，参数为高亮所属页面URL
+    highlights_changed = pyqtSignal(str)
+    
+    # 页面脚本和日志处理器都运行在页面主世界中，以便与网页自身脚本交互
+    MAIN_WORLD = QWebEngineScript.ScriptWorldId.MainWorld
+    
+    def __init__(self, ai_config, profile=None, load_delay=0):
         """初始化AI网页视图
         
         Args:
             ai_config (dict): AI平台配置字典
+            profile (QWebEngineProfile, optional): 共享的profile，未提供时从WebProfileManager获取
+            load_delay (int): 延迟多少毫秒后开始加载页面，用于错开多个视图的启动
         """
         super().__init__()
-        self.ai_name = ai_config["name"]
-        self.ai_url = ai_config["url"]
-        self.input_selector = ai_config["input_selector"]
-        self.submit_selector = ai_config["submit_selector"]
-        self.response_selector = ai_config.get("response_selector", "")
+        self.apply_platform_config(ai_config)
         
         # 初始化日志器
         self.logger = logging.getLogger(f"AiSparkHub.AIView.{self.ai_name}")
-        self.logger.info(f"初始化 {self.ai_name} 视图")
+        self.logger.info("初始化 %s 视图", self.ai_name)
         
         # 使用共享的profile，保存登录信息
-        self.profile_manager = WebProfileManager()
-        shared_profile = self.profile_manager.get_profile()
+        if profile is None:
+            profile = WebProfileManager().get_profile()
         
         # 使用自定义Page以捕获网页日志
-        web_page = WebEnginePage(shared_profile, self)
+        web_page = WebEnginePage(profile, self)
         self.setPage(web_page)
         
-        # 设置剪贴板权限
-        settings = web_page.settings()
-        
-        # 设置权限 - 使用try/except以兼容不同版本的PyQt6
-        # 剪贴板权限
-        try:
-            settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptCanAccessClipboard, True)
-            self.logger.debug(f"已启用剪贴板访问权限")
-        except (AttributeError, TypeError):
-            self.logger.warning(f"JavascriptCanAccessClipboard属性不可用")
+        # 注册页面脚本，之后每次文档加载都由WebEngine自动执行
+        self._register_page_scripts()
         
-        try:
-            settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptCanPaste, True)
-            self.logger.debug(f"已启用剪贴板粘贴权限")
-        except (AttributeError, TypeError):
-            self.logger.warning(f"JavascriptCanPaste属性不可用")
-        
-        # 其他权限
-        try:
-            settings.setAttribute(QWebEngineSettings.WebAttribute.FullScreenSupportEnabled, True)
-            self.logger.debug(f"已启用全屏支持")
-        except (AttributeError, TypeError):
-            self.logger.warning(f"FullScreenSupportEnabled属性不可用")
-        
-        try:
-            settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessRemoteUrls, True)
-            self.logger.debug(f"已启用本地内容访问远程URL")
-        except (AttributeError, TypeError):
-            self.logger.warning(f"LocalContentCanAccessRemoteUrls属性不可用")
-            
-        try:
-            settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, True)
-            self.logger.debug(f"已启用本地内容访问文件URL")
-        except (AttributeError, TypeError):
-            self.logger.warning(f"LocalContentCanAccessFileUrls属性不可用")
+        # 启用剪贴板、全屏及本地内容访问等权限（当前PyQt6版本不支持的属性已在模块加载时剔除）
+        settings = web_page.settings()
+        for attribute in _ENABLED_WEB_ATTRIBUTES:
+            settings.setAttribute(attribute, True)
         
         # 设置最小高度
         self.setMinimumHeight(30)
         
-        # 加载网页
-        self.load(QUrl(self.ai_url))
+        # 缓存当前URL字符串，避免频繁在QUrl和字符串之间转换
+        self.current_url = ""
+        self.urlChanged.connect(self._on_url_changed)
+        
+        # 备用通信监控定时器，首次页面加载完成时创建
+        self.storage_timer = None
+        self.clipboard_timer = None
+        
+        # 页面加载完成前收到的提示词脚本，加载完成后依次执行
+        self._page_ready = False
+        self._pending_prompt_scripts = []
         
         # 设置加载状态监听
+        self.loadStarted.connect(self._on_load_started)
         self.loadFinished.connect(self.on_load_finished)
         
-        # 设置JavaScript日志处理器
-        self.page().settings().setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)
+        # 加载网页；延迟加载使用可取消的单次定时器，首次加载发出后置为None
+        self._load_timer = None
+        if load_delay > 0:
+            self._load_timer = QTimer(self)
+            self._load_timer.setSingleShot(True)
+            self._load_timer.timeout.connect(self._load_platform_url)
+            self._load_timer.start(load_delay)
+        else:
+            self._load_platform_url()
         
         # 获取数据库管理器实例
         app = QApplication.instance()
@@ -175,77 +573,111 @@ class AIWebView(QWebEngineView):
         else:
             from app.models.database import DatabaseManager
             self.db_manager = DatabaseManager()
-            self.logger.warning(f"无法从应用实例获取数据库管理器，创建新实例")
+            self.logger.warning("无法从应用实例获取数据库管理器，创建新实例")
+    
+    @pyqtSlot()
+    def _load_platform_url(self):
+        """加载当前平台的首页，同时取消尚未触发的延迟加载"""
+        if self._load_timer is not None:
+            self._load_timer.stop()
+            self._load_timer.deleteLater()
+            self._load_timer = None
+        self.load(QUrl(self.ai_url))
+    
+    def apply_platform_config(self, ai_config):
+        """设置视图对应的平台信息（名称、地址及各选择器）
+        
+        Args:
+            ai_config (dict): AI平台配置字典
+        """
+        self.ai_name = ai_config["name"]
+        self.ai_url = ai_config["url"]
+        self.input_selector = ai_config["input_selector"]
+        self.submit_selector = ai_config["submit_selector"]
+        self.response_selector = ai_config.get("response_selector", "")
+    
+    def switch_platform(self, ai_config):
+        """将已创建的视图切换到另一个AI平台，同步更新日志器和页面日志名称，不重新加载页面
+        
+        Args:
+            ai_config (dict): 新的AI平台配置字典
+        """
+        self.apply_platform_config(ai_config)
+        self.logger = logging.getLogger(f"AiSparkHub.AIView.{self.ai_name}")
+        self.page().view_name = self.ai_name
+    
+    def reconfigure(self, ai_config):
+        """将视图切换为另一个AI平台并加载其页面，复用现有的渲染进程
+        
+        Args:
+            ai_config (dict): 新的AI平台配置字典
+        """
+        self.switch_platform(ai_config)
+        # 旧页面排队的提示词不再适用于新平台；loadStarted是异步的，
+        # 这里先标记页面未就绪，之后的提示词排队等待新页面加载完成
+        self._page_ready = False
+        self._pending_prompt_scripts = []
+        self._load_platform_url()
+        self.logger.info(f"复用视图并切换到 {self.ai_name}")
+    
+    @pyqtSlot(QUrl)
+    def _on_url_changed(self, url):
+        """URL变化时更新缓存的URL字符串"""
+        self.current_url = url.toString()
+    
+    @pyqtSlot()
+    def _on_load_started(self):
+        """开始加载新页面时，注入脚本尚未就绪"""
+        self._page_ready = False
     
     def on_load_finished(self, success):
         """网页加载完成后的处理"""
         if success:
-            self.logger.info(f"页面加载完成: {self.url().toString()}")
-            try:
-                from PyQt6.QtWebEngineCore import QWebEngineScript
-                self.MAIN_WORLD = QWebEngineScript.ScriptWorldId.MainWorld
-                self.logger.info("导入ScriptWorldId成功，使用MainWorld注入")
-            except (ImportError, AttributeError):
-                self.MAIN_WORLD = 0  # 默认值，如果无法导入
-                self.logger.warning("无法导入ScriptWorldId，使用默认值0")
-            
-            # 串行注入所有依赖脚本
-            self._inject_rangy_core()
+            self.logger.info("页面加载完成: %s", self.current_url)
+            # 页面脚本已在文档就绪时执行，这里只做后续初始化
+            self._page_ready = True
+            self._after_all_scripts()
+            self._flush_pending_prompts()
         else:
             self.logger.error(f"页面加载失败: {self.url().toString()}")
+            # 加载失败时丢弃排队的提示词，避免之后的页面加载重放过期内容
+            if self._pending_prompt_scripts:
+                self.logger.warning("页面加载失败，丢弃 %d 条待发送的提示词", len(self._pending_prompt_scripts))
+                self._pending_prompt_scripts = []
 
-    def _inject_rangy_core(self):
-        """注入rangy-core.min.js"""
-        import os
-        current_file = os.path.abspath(__file__)
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(current_file)))
-        script_path = os.path.join(base_dir, "app", "static", "js", "rangy-core.min.js")
-        self._inject_js_file(script_path, callback=self._inject_rangy_classapplier)
-
-    def _inject_rangy_classapplier(self):
-        """注入rangy-classapplier.min.js"""
-        import os
-        current_file = os.path.abspath(__file__)
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(current_file)))
-        script_path = os.path.join(base_dir, "app", "static", "js", "rangy-classapplier.min.js")
-        self._inject_js_file(script_path, callback=self._inject_rangy_highlighter)
-
-    def _inject_rangy_highlighter(self):
-        """注入rangy-highlighter.min.js"""
-        import os
-        current_file = os.path.abspath(__file__)
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(current_file)))
-        script_path = os.path.join(base_dir, "app", "static", "js", "rangy-highlighter.min.js")
-        self._inject_js_file(script_path, callback=self._inject_prompt_injector)
-
-    def _inject_prompt_injector(self):
-        """注入prompt_injector.js"""
-        self._inject_js_file(INJECTOR_SCRIPT_PATH, callback=self._after_all_scripts)
+    def _register_page_scripts(self):
+        """将依赖库和注入脚本注册为本页面的QWebEngineScript
+        
+        脚本在DocumentReady时按注册顺序执行，导航后无需再从Python逐个注入。
+        只注册到本视图的page上，共享profile的普通浏览页面不受影响。
+        """
+        scripts = self.page().scripts()
+        sources = [(os.path.basename(path), _read_script(path)) for path in PAGE_SCRIPT_PATHS]
+        sources.append(("fallback-highlight", _FALLBACK_HIGHLIGHT_SCRIPT))
+        sources.append(("log-handler", _LOG_HANDLER_SCRIPT))
+        for name, source in sources:
+            if source is None:
+                self.logger.error(f"无法读取页面脚本: {name}")
+                continue
+            script = QWebEngineScript()
+            script.setName(f"aisparkhub-{name}")
+            script.setSourceCode(source)
+            script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentReady)
+            script.setWorldId(self.MAIN_WORLD)
+            script.setRunsOnSubFrames(False)
+            scripts.insert(script)
+        self.logger.debug("已注册 %d 个页面脚本", len(sources))
 
     def _after_all_scripts(self):
-        """所有依赖脚本注入完成后，初始化业务逻辑"""
-        self._install_js_log_handler()
-        self.inject_script()  # 业务脚本的备用通信增强
+        """所有依赖脚本注入完成后，初始化业务逻辑
+        
+        日志处理器已作为页面脚本注册，这里不再额外调用runJavaScript；
+        备用通信监控器只需启动一次，之后的导航复用同一组定时器。
+        """
+        if self.storage_timer is None:
+            self._setup_storage_monitor()
         self.load_highlights_for_current_page()
 
-    def _inject_js_file(self, script_path, callback=None):
-        """读取并注入本地js文件，注入完成后执行回调"""
-        script_file = QFile(script_path)
-        if not script_file.exists():
-            self.logger.error(f"脚本文件不存在: {script_path}")
-            if callback:
-                callback()
-            return
-        if script_file.open(QIODevice.ReadOnly | QIODevice.Text):
-            script_content = script_file.readAll().data().decode('utf-8')
-            script_file.close()
-            self.page().runJavaScript(script_content, self.MAIN_WORLD, lambda _: callback() if callback else None)
-            self.logger.info(f"已注入脚本: {os.path.basename(script_path)}")
-        else:
-            self.logger.error(f"无法打开脚本文件: {script_path}")
-            if callback:
-                callback()
-    
     def save_highlight_from_js(self, highlight_json):
         """从JavaScript接收高亮数据并保存到数据库
         
@@ -282,6 +714,7 @@ class AIWebView(QWebEngineView):
             
             if highlight_id:
                 self.logger.info(f"成功保存高亮数据，ID: {highlight_id}")
+                self.highlights_changed.emit(url)
             else:
                 self.logger.error(f"保存高亮数据失败，返回的ID为空或无效")
             
@@ -402,64 +835,37 @@ class AIWebView(QWebEngineView):
             import traceback
             self.logger.error(traceback.format_exc())
     
-    def inject_script(self):
-        """注入提示词注入脚本"""
-        try:
-            # 读取脚本文件
-            script_file = QFile(INJECTOR_SCRIPT_PATH)
-            
-            if script_file.open(QIODevice.ReadOnly | QIODevice.Text):
-                script_content = script_file.readAll().data().decode('utf-8')
-                script_file.close()
-                
-                # 添加备用通信功能
-                fallback_script = """
-                // 添加备用高亮功能
-                if (typeof saveHighlightToPython === 'function') {
-                    const originalSaveHighlight = saveHighlightToPython;
-                    saveHighlightToPython = function(highlightData) {
-                        try {
-                            // 直接使用备用方式保存
-                            if (window.AiSparkHub && window.AiSparkHub.fallbackHighlight) {
-                                window.AiSparkHub.fallbackHighlight(highlightData);
-                                return true;
-                            }
-                        } catch(e) {
-                            console.error('高亮保存失败:', e);
-                        }
-                        return false;
-                    };
-                    console.log('已设置备用高亮保存功能');
-                }
-                """
-                
-                # 组合脚本
-                combined_script = script_content + "\n" + fallback_script
-                
-                # 注入脚本
-                self.page().runJavaScript(combined_script)
-                self.logger.debug(f"已注入提示词脚本（包含备用通信功能）")
-            else:
-                self.logger.error(f"无法打开脚本文件: {INJECTOR_SCRIPT_PATH}")
-        except Exception as e:
-            self.logger.exception(f"注入脚本时出错")
-    
     def fill_prompt(self, prompt_text):
         """填充提示词并提交
         
         Args:
             prompt_text (str): 提示词文本
         """
-        # 确保特殊字符的正确转义 (单引号、换行符、回车符和反斜杠)
-        escaped_text = prompt_text.replace('\\', '\\\\').replace("'", "\\'").replace('\n', '\\n').replace('\r', '\\r')
-            
-        # 调用注入方法 - 使用预先加载的脚本函数
-        js_code = f"window.AiSparkHub.injectPrompt('{escaped_text}')"
-        self.page().runJavaScript(js_code, self._handle_injection_result)
+        self.run_prompt_script(build_inject_prompt_script(prompt_text))
     
-    def _handle_check_result(self, result):
-        """处理脚本检查结果"""
-        self.logger.debug(f"脚本检查结果: {result}")
+    def run_prompt_script(self, js_code):
+        """执行已构建好的提示词注入脚本
+        
+        Args:
+            js_code (str): build_inject_prompt_script() 生成的脚本
+        """
+        # 页面尚未加载完成时注入脚本不可用，先排队等待加载完成
+        if not self._page_ready:
+            self._pending_prompt_scripts.append(js_code)
+            self.logger.debug("页面尚未加载完成，提示词已排队")
+            return
+        
+        # 注入结果只用于调试日志，未开启调试时不回传结果
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.page().runJavaScript(js_code, self._handle_injection_result)
+        else:
+            self.page().runJavaScript(js_code)
+    
+    def _flush_pending_prompts(self):
+        """执行页面加载期间排队的提示词脚本"""
+        pending, self._pending_prompt_scripts = self._pending_prompt_scripts, []
+        for js_code in pending:
+            self.run_prompt_script(js_code)
     
     def _handle_injection_result(self, result):
         """处理注入结果"""
@@ -489,71 +895,6 @@ class AIWebView(QWebEngineView):
         """
         self.page().runJavaScript("window.AiSparkHub.getPromptResponse()", callback)
 
-    def _install_js_log_handler(self):
-        """安装JavaScript日志处理器，接收前端发送的日志"""
-        js_code = """
-        document.addEventListener('aiSendLogToPython', function(event) {
-            try {
-                // 只记录到控制台
-                const logData = JSON.parse(event.detail);
-                console.log('JS日志:', logData);
-            } catch(e) {
-                console.error('处理日志失败:', e);
-            }
-        });
-        
-        // 添加备用通信方式 - 通过LocalStorage
-        window.AiSparkHub = window.AiSparkHub || {};
-        window.AiSparkHub.fallbackHighlight = function(highlightData) {
-            try {
-                console.log('使用备用方式(LocalStorage)发送高亮数据');
-                // 生成唯一key并存入LocalStorage
-                const key = 'HIGHLIGHT_' + Date.now() + '_' + Math.random().toString(36).substring(2, 10);
-                localStorage.setItem(key, JSON.stringify(highlightData));
-                console.log('高亮数据已保存到LocalStorage，键名:', key);
-                return true;
-            } catch(e) {
-                console.error('备用高亮方式(LocalStorage)失败:', e);
-                // 尝试其他可能的备用机制
-                try {
-                    // 特殊格式化，前缀标识这是一个高亮数据
-                    const encodedData = 'HIGHLIGHT:' + JSON.stringify(highlightData);
-                    
-                    // 尝试写入剪贴板 (作为最后的备用)
-                    if (navigator.clipboard && navigator.clipboard.writeText) {
-                        navigator.clipboard.writeText(encodedData)
-                            .then(() => console.log('高亮数据已写入剪贴板(备用方案2)'))
-                            .catch(err => console.error('剪贴板写入失败:', err));
-                    } else {
-                        console.error('所有备用方案均失败');
-                    }
-                } catch(clipboardError) {
-                    console.error('所有备用通信方式均失败');
-                }
-                return false;
-            }
-        };
-
-        // 使直接保存函数使用备用方案
-        window.saveHighlightToPython = function(highlightData) {
-            try {
-                // 直接使用备用方式
-                window.AiSparkHub.fallbackHighlight(highlightData);
-                return true;
-            } catch(e) {
-                console.error('保存高亮失败:', e);
-                return false;
-            }
-        };
-        """
-        
-        # 运行JavaScript代码
-        self.page().runJavaScript(js_code, self.MAIN_WORLD)
-        self.logger.info("已注入日志处理器和辅助函数")
-        
-        # 启动备用通信监控器
-        self._setup_storage_monitor()
-    
     def _setup_storage_monitor(self):
         """设置LocalStorage监控，作为备用通信方式"""
         self.logger.info("启动LocalStorage监控作为备用通信方式")
@@ -571,6 +912,21 @@ class AIWebView(QWebEngineView):
         # 缓存上一次剪贴板内容，避免重复处理
         self.last_clipboard_text = ""
     
+    def pause_monitors(self):
+        """停止备用通信监控定时器及尚未触发的延迟加载（视图放入视图池闲置时调用）"""
+        for timer in (self._load_timer, self.storage_timer, self.clipboard_timer):
+            if timer is not None:
+                timer.stop()
+    
+    def resume_monitors(self):
+        """恢复备用通信监控定时器（视图从视图池取出时调用），尚未创建时由页面加载完成后创建"""
+        # 放入视图池前延迟加载尚未触发的，取出时立即加载
+        if self._load_timer is not None:
+            self._load_platform_url()
+        for timer in (self.storage_timer, self.clipboard_timer):
+            if timer is not None:
+                timer.start()
+    
     def _check_local_storage(self):
         """检查LocalStorage是否有高亮数据"""
         js_code = """
@@ -695,6 +1051,66 @@ class AIWebView(QWebEngineView):
         except Exception as e:
             self.logger.error(f"处理JS日志时出错: {e}")
 
+class AIContainer(QWidget):
+    """单个AI视图的容器，包含标题栏和网页视图
+    
+    所有属性在构造时给出默认值，调用方可直接判断是否为None，无需hasattr探测。
+    网页视图延迟到容器首次显示时才创建，在此之前其配置保存在pending_config中。
+    """
+    
+    # 容器首次显示且网页视图尚未创建时发出
+    first_shown = pyqtSignal()
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.web_view = None  # 当前加载的AIWebView
+        self.ai_key = None  # 当前加载的AI平台标识
+        self.pending_config = None  # 尚未创建网页视图时的AI平台配置
+        self.highlight_btn = None
+        self.move_left_btn = None
+        self.move_right_btn = None
+        self.refresh_btn = None
+        self.maximize_btn = None
+        self.add_btn = None
+        self.close_btn = None
+        self.is_maximized = False  # 记录是否处于最大化状态
+        # 高亮弹窗定位坐标缓存：(缓存键, 高亮按钮左下角, web_view左上角, web_view宽度)
+        self._popup_anchor = None
+    
+    def popup_anchor(self):
+        """获取高亮弹窗定位所需的全局坐标
+        
+        窗口、容器和高亮按钮均未移动时直接复用上次计算结果，避免重复的坐标映射。
+        
+        Returns:
+            tuple: (高亮按钮左下角全局坐标, web_view左上角全局坐标, web_view宽度)
+        """
+        key = (self.window().pos(), self.highlight_btn.pos())
+        cached = self._popup_anchor
+        if cached is None or cached[0] != key:
+            btn_pos = self.highlight_btn.mapToGlobal(self.highlight_btn.rect().bottomLeft())
+            webview_rect = self.web_view.rect()
+            webview_pos = self.web_view.mapToGlobal(webview_rect.topLeft())
+            cached = (key, btn_pos, webview_pos, webview_rect.width())
+            self._popup_anchor = cached
+        return cached[1:]
+    
+    def showEvent(self, event):
+        """首次显示时通知创建网页视图"""
+        super().showEvent(event)
+        if self.pending_config is not None:
+            self.first_shown.emit()
+    
+    def moveEvent(self, event):
+        """容器位置变化时使弹窗坐标缓存失效"""
+        self._popup_anchor = None
+        super().moveEvent(event)
+    
+    def resizeEvent(self, event):
+        """容器尺寸变化时使弹窗坐标缓存失效"""
+        self._popup_anchor = None
+        super().resizeEvent(event)
+
 class AIView(QWidget):
     """AI对话页面，管理多个AI网页视图"""
     
@@ -706,9 +1122,13 @@ class AIView(QWidget):
         
         # 将 ThemeManager 初始化移到开头
         self.theme_manager = None
+        # 当前主题颜色缓存，主题变化时失效
+        self._theme_cache = None
         app = QApplication.instance()
         if hasattr(app, 'theme_manager') and isinstance(app.theme_manager, ThemeManager):
             self.theme_manager = app.theme_manager
+            # 先使颜色缓存失效，再更新图标，保证图标使用新主题颜色
+            self.theme_manager.theme_changed.connect(self._invalidate_theme_cache)
             self.theme_manager.theme_changed.connect(self._update_all_button_icons)
             self.logger.debug("已连接主题管理器")
         else:
@@ -735,27 +1155,93 @@ class AIView(QWidget):
         self.splitter = QSplitter(Qt.Orientation.Horizontal)
         self.layout.addWidget(self.splitter)
         
-        # 存储AI网页视图
-        self.ai_web_views = {}
+        # 各URL的高亮数量缓存(url -> (数量, 缓存时间))
+        self._highlight_count_cache = {}
+        # 当前打开的高亮弹窗，事件过滤器据此识别弹窗事件
+        self._active_highlight_dialog = None
+        # 切换平台时换下的网页视图池(key -> AIWebView)，按最近使用顺序排列
+        self._web_view_pool = OrderedDict()
+        
+        # 新建容器的高亮计数首次更新，由一个共享的单次定时器批量处理
+        self._pending_highlight_update = []
+        self._highlight_update_timer = QTimer(self)
+        self._highlight_update_timer.setSingleShot(True)
+        self._highlight_update_timer.setInterval(1000)
+        self._highlight_update_timer.timeout.connect(self._flush_highlight_updates)
+        
+        # 视图增删/移动后的分割器宽度调整与导航按钮更新，合并到下一次事件循环统一执行
+        self._refresh_sizes_pending = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        
+        # 下一个新建视图最早可以开始加载页面的时间，用于错开启动
+        self._next_load_time = 0.0
+        
+        # 所有AI网页视图共用同一个profile，共享登录信息和缓存
+        self._shared_profile = WebProfileManager().get_profile()
+        
+        # 所有容器的AI选择下拉框共用一个平台模型，图标只加载一次
+        self._build_platform_model()
         
         # 加载用户配置的AI平台
         self.load_ai_platforms()
     
+    def _build_platform_model(self):
+        """构建AI平台下拉列表模型及平台key到行号的映射"""
+        self._platform_model = QStandardItemModel(self)
+        self._platform_key_to_index = {}
+        for platform_config in SUPPORTED_AI_PLATFORMS.values():
+            lowercase_key = platform_config["key"]
+            item = QStandardItem(_platform_icon(lowercase_key), platform_config["name"])
+            # 将平台 key (小写) 作为 userData 存储
+            item.setData(lowercase_key, Qt.ItemDataRole.UserRole)
+            self._platform_key_to_index.setdefault(lowercase_key, self._platform_model.rowCount())
+            self._platform_model.appendRow(item)
+    
     def load_ai_platforms(self):
         """根据用户设置加载AI平台"""
         # 获取用户启用的AI平台
         enabled_platforms = self.settings_manager.get_enabled_ai_platforms()
+        target_keys = {platform["key"] for platform in enabled_platforms}
+        
+        with self._batch_splitter_updates():
+            # 只移除不再启用（或重复）的视图，保留仍然启用的视图
+            existing = {}
+            for container in [self.splitter.widget(i) for i in range(self.splitter.count())]:
+                if container.ai_key in target_keys and container.ai_key not in existing:
+                    existing[container.ai_key] = container
+                    continue
+                self._discard_container(container)
+            
+            # 按设置顺序补齐缺少的视图并调整位置
+            for index, platform in enumerate(enabled_platforms):
+                container = existing.get(platform["key"])
+                if container is None:
+                    self.add_ai_web_view_from_config(platform)
+                    container = self.splitter.widget(self.splitter.count() - 1)
+                if self.splitter.indexOf(container) != index:
+                    self.splitter.insertWidget(index, container)
+            
+            self._schedule_refresh()
+    
+    def _discard_container(self, container):
+        """从分割器中移除并销毁容器，同时清理相关引用
         
-        # 清空现有视图
-        for i in range(self.splitter.count()):
-            widget = self.splitter.widget(0)
-            widget.setParent(None)
-        
-        self.ai_web_views.clear()
-        
-        # 加载新视图
-        for platform in enabled_platforms:
-            self.add_ai_web_view_from_config(platform)
+        Args:
+            container: 要移除的容器
+        """
+        ai_key = container.ai_key
+        if container in self._pending_highlight_update:
+            self._pending_highlight_update.remove(container)
+        # 已创建的网页视图放入视图池，重新启用该平台时可直接复用，无需重建渲染进程
+        if ai_key is not None and container.web_view is not None:
+            container.layout().removeWidget(container.web_view)
+            self._release_web_view(ai_key, container.web_view)
+            container.web_view = None
+        container.setParent(None)
+        container.deleteLater()
     
     def add_ai_web_view_from_config(self, ai_config):
         """从配置添加AI网页视图
@@ -764,10 +1250,13 @@ class AIView(QWidget):
             ai_config (dict): AI平台配置
         
         Returns:
-            AIWebView: 创建的AI网页视图
+            AIWebView: 创建的AI网页视图；网页视图延迟到容器首次显示时创建，
+                此时容器尚未显示则返回None
         """
         # 创建容器和标题
-        container = QWidget()
+        container = AIContainer()
+        # 构建期间暂停容器重绘，之后加入的子控件会继承该状态，避免每次addWidget都触发重新绘制
+        container.setUpdatesEnabled(False)
         container_layout = QVBoxLayout(container)
         container_layout.setContentsMargins(0, 0, 0, 0)
         container_layout.setSpacing(0)  # 设置布局间距为0，消除标题栏与网页内容之间的空白
@@ -784,160 +1273,70 @@ class AIView(QWidget):
         ai_selector.setObjectName("aiSelector")
         ai_selector.setFixedHeight(24)
         
-        # 获取所有支持的AI平台
-        platforms = list(SUPPORTED_AI_PLATFORMS.items())
+        self.logger.debug("加载AI平台选择器: %s (key: %s)", ai_config['name'], ai_config['key'])
         
-        # 为每个平台创建图标和添加到下拉菜单
-        self.logger.debug(f"加载AI平台选择器: {ai_config['name']} (key: {ai_config['key']})")
-        for i, (dict_key, platform_config) in enumerate(platforms):
-            icon = None
-            lowercase_key = platform_config["key"]
-            
-            # 先尝试加载本地图标文件
-            icon_path = os.path.join(ICON_DIR, f"{lowercase_key}.png") # 先尝试png
-            if not os.path.exists(icon_path):
-                icon_path = os.path.join(ICON_DIR, f"{lowercase_key}.ico") # 再尝试ico
-            
-            if os.path.exists(icon_path):
-                # 加载图标
-                try:
-                    if icon_path.endswith('.ico'):
-                        icon = QIcon(icon_path)
-                    else:
-                        icon = QIcon(QPixmap(icon_path))
-                except Exception as e:
-                    self.logger.warning(f"从{icon_path}加载图标失败: {str(e)}")
-                    icon = None  # 加载失败，设为None以便尝试qtawesome
-            else:
-                self.logger.debug(f"未找到{lowercase_key}的本地图标，尝试使用qtawesome")
-            
-            # 如果本地图标加载失败，尝试使用qtawesome
-            if icon is None:
-                try:
-                    # 根据AI平台选择合适的图标
-                    icon_map = {
-                        "chatgpt": "fa5b.chrome",      # ChatGPT使用Chrome图标
-                        "kimi": "fa5s.robot",          # Kimi使用机器人图标
-                        "doubao": "fa5s.comment",      # 其他平台使用通用对话图标
-                        "yuanbao": "fa5s.comment-dots",
-                        "perplexity": "fa5s.search",   # Perplexity用搜索图标
-                        "metaso": "fa5s.search",       # 元搜索用搜索图标
-                        "grok": "fa5b.twitter",        # Grok关联Twitter/X
-                        "yiyan": "fa5b.baidu",         # 文心一言用百度图标
-                        "gemini": "fa5b.google",       # Gemini用Google图标
-                        "tongyi": "fa5b.alipay",       # 通义用阿里图标
-                        "chatglm": "fa5s.brain",       # ChatGLM用脑图标
-                        "biji": "fa5s.sticky-note",    # 笔记用便签图标
-                        "n": "fa5s.yin-yang",          # N用特殊图标
-                        "deepseek": "fa5s.power-off"   # DeepSeek用电源图标
-                    }
-                    
-                    # 获取该平台对应的图标名，如果没有指定则使用评论图标
-                    icon_name = icon_map.get(lowercase_key, "fa5s.comment")
-                    icon = qta.icon(icon_name)
-                except Exception as e:
-                    self.logger.warning(f"使用qtawesome图标失败({lowercase_key}): {str(e)}")
-                    # 如果qtawesome也失败，使用默认图标
-                    icon = qta.icon("fa5s.comment")
-                    self.logger.debug(f"使用默认qtawesome图标: fa5s.comment")
-            
-            # 添加到下拉菜单，将平台 key (小写) 作为 userData 存储
-            ai_selector.addItem(icon, platform_config["name"], userData=lowercase_key)
-            
-        # 手动查找目标索引
+        # 使用所有容器共享的平台模型，填充期间屏蔽信号，避免触发currentIndexChanged
+        ai_selector.blockSignals(True)
+        ai_selector.setModel(self._platform_model)
+        
+        # 设置当前选中的AI（按预先建立的key到索引映射查找）
         target_key_to_find = ai_config["key"]
-        found_index = -1
-        for idx in range(ai_selector.count()):
-            item_data = ai_selector.itemData(idx)
-            # 确保比较的是同类型且值相等
-            if isinstance(item_data, str) and item_data == target_key_to_find:
-                found_index = idx
-                break # 找到即停止
-        
-        # 设置当前选中的AI
+        found_index = self._platform_key_to_index.get(target_key_to_find, -1)
         if found_index != -1:
             ai_selector.setCurrentIndex(found_index)
         else:
             self.logger.warning(f"未找到{target_key_to_find}对应的索引，默认使用第一项")
             ai_selector.setCurrentIndex(0) # 如果找不到，默认显示第一项
+        ai_selector.blockSignals(False)
         
         # 连接选择变更信号
-        ai_selector.currentIndexChanged.connect(lambda index, c=container, s=ai_selector: self.on_ai_changed(c, index, s))
-        
-        # 创建控制按钮的通用样式 - 添加 hover 和 pressed 样式
-        button_style = """
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                padding: 2px;
-                border-radius: 3px;
-                max-width: 22px;
-                max-height: 22px;
-            }
-            QPushButton:hover {
-                background-color: rgba(120, 120, 120, 0.2);
-            }
-            QPushButton:pressed {
-                background-color: rgba(100, 100, 100, 0.3);
-            }
-        """
+        ai_selector.currentIndexChanged.connect(partial(self._on_ai_changed_slot, container, ai_selector))
+        
+        # 控制按钮的样式（含hover/pressed）由主题样式表中的 QWidget#aiTitleBar QPushButton 规则统一提供
+        # 按钮图标按主题颜色在 _set_initial_button_icons 中统一设置，这里不再预先生成无色图标
         
         # 创建高亮按钮
         highlight_btn = QPushButton()
-        highlight_btn.setIcon(qta.icon("fa5s.highlighter"))
         highlight_btn.setToolTip("显示页面高亮内容")
-        highlight_btn.setStyleSheet(button_style)
-        highlight_btn.setIconSize(QSize(14, 14))
-        highlight_btn.clicked.connect(lambda _, c=container: self.show_highlights(c))
+        highlight_btn.setIconSize(_TITLE_BUTTON_ICON_SIZE)
+        highlight_btn.clicked.connect(self._on_highlight_btn_clicked)
         
         # 创建控制按钮
         # 1. 向左移动按钮
         move_left_btn = QPushButton()
-        move_left_btn.setIcon(qta.icon("fa5s.arrow-left"))
         move_left_btn.setToolTip("将此视图向左移动")
-        move_left_btn.setStyleSheet(button_style)
-        move_left_btn.setIconSize(QSize(14, 14))
-        move_left_btn.clicked.connect(lambda _, c=container: self.move_view_left(c))
+        move_left_btn.setIconSize(_TITLE_BUTTON_ICON_SIZE)
+        move_left_btn.clicked.connect(self._on_move_left_clicked)
         
         # 2. 向右移动按钮
         move_right_btn = QPushButton()
-        move_right_btn.setIcon(qta.icon("fa5s.arrow-right"))
         move_right_btn.setToolTip("将此视图向右移动")
-        move_right_btn.setStyleSheet(button_style)
-        move_right_btn.setIconSize(QSize(14, 14))
-        move_right_btn.clicked.connect(lambda _, c=container: self.move_view_right(c))
+        move_right_btn.setIconSize(_TITLE_BUTTON_ICON_SIZE)
+        move_right_btn.clicked.connect(self._on_move_right_clicked)
         
         # 3. 刷新按钮
         refresh_btn = QPushButton()
-        refresh_btn.setIcon(qta.icon("fa5s.sync"))
         refresh_btn.setToolTip("刷新此视图")
-        refresh_btn.setStyleSheet(button_style)
-        refresh_btn.setIconSize(QSize(14, 14))
-        refresh_btn.clicked.connect(lambda _, c=container: self.refresh_view(c))
+        refresh_btn.setIconSize(_TITLE_BUTTON_ICON_SIZE)
+        refresh_btn.clicked.connect(self._on_refresh_clicked)
         
         # 4. 最大化/恢复按钮
         maximize_btn = QPushButton()
-        maximize_btn.setIcon(qta.icon("fa5s.expand"))
         maximize_btn.setToolTip("最大化此视图")
-        maximize_btn.setStyleSheet(button_style)
-        maximize_btn.setIconSize(QSize(14, 14))
-        maximize_btn.clicked.connect(lambda _, c=container, b=maximize_btn: self.toggle_maximize_view(c, b))
+        maximize_btn.setIconSize(_TITLE_BUTTON_ICON_SIZE)
+        maximize_btn.clicked.connect(self._on_maximize_clicked)
         
         # 5. 添加视图按钮
         add_btn = QPushButton()
-        add_btn.setIcon(qta.icon("fa5s.plus"))
         add_btn.setToolTip("在右侧添加新视图")
-        add_btn.setStyleSheet(button_style)
-        add_btn.setIconSize(QSize(14, 14))
-        add_btn.clicked.connect(lambda _, c=container: self.add_view_after(c))
+        add_btn.setIconSize(_TITLE_BUTTON_ICON_SIZE)
+        add_btn.clicked.connect(self._on_add_clicked)
         
         # 6. 关闭按钮
         close_btn = QPushButton()
-        close_btn.setIcon(qta.icon("fa5s.times"))
         close_btn.setToolTip("关闭此视图")
-        close_btn.setStyleSheet(button_style)
-        close_btn.setIconSize(QSize(14, 14))
-        close_btn.clicked.connect(lambda _, c=container: self.close_view(c))
+        close_btn.setIconSize(_TITLE_BUTTON_ICON_SIZE)
+        close_btn.clicked.connect(self._on_close_clicked)
         
         # 存储按钮引用，以便后续访问
         container.highlight_btn = highlight_btn
@@ -947,10 +1346,6 @@ class AIView(QWidget):
         container.maximize_btn = maximize_btn
         container.add_btn = add_btn
         container.close_btn = close_btn
-        container.is_maximized = False  # 记录是否处于最大化状态
-        
-        # 设置按钮初始图标（带颜色）
-        self._set_initial_button_icons(container)
         
         # 将下拉菜单添加到标题栏
         title_layout.addWidget(ai_selector)
@@ -968,34 +1363,102 @@ class AIView(QWidget):
         # 添加标题栏到容器
         container_layout.addWidget(title_widget)
         
-        # 创建AI网页视图
-        web_view = AIWebView(ai_config)
-        
-        # 添加到容器并存储
-        container_layout.addWidget(web_view)
-        container.web_view = web_view  # 将web_view作为容器的属性存储
+        # 网页视图创建开销较大，延迟到容器首次显示时再创建
         container.ai_key = ai_config["key"]  # 存储当前加载的AI平台标识
+        container.pending_config = ai_config
+        container.first_shown.connect(partial(self._create_container_web_view, container))
         
-        # 添加到分割器
+        # 添加到分割器（若分割器已显示，容器会立即显示并创建网页视图）
         self.splitter.addWidget(container)
+        # 各视图拉伸系数相同，窗口缩放时由分割器自行按比例分配宽度
+        self.splitter.setStretchFactor(self.splitter.count() - 1, 1)
         
-        # 存储网页视图 (确保key与存储时一致)
-        self.ai_web_views[ai_config["key"]] = web_view
+        # 调整分割器各部分的宽度比例并更新导航按钮状态（延迟合并执行）
+        self._schedule_refresh()
         
-        # 调整分割器各部分的宽度比例
-        self.adjust_splitter_sizes()
+        # 设置按钮初始图标（带颜色），只需设置一次；此时web_view通常仍为None（在first_shown时才延迟创建），
+        # 高亮数量稍后由_flush_highlight_updates补上
+        self._set_initial_button_icons(container)
         
-        # 更新导航按钮状态
-        self.update_navigation_buttons()
+        # 构建完成，恢复重绘（若分割器正处于批量更新中，会在分割器恢复时统一刷新）
+        container.setUpdatesEnabled(True)
         
-        # 添加新方法：设置按钮初始图标
-        self._set_initial_button_icons(container)
+        return container.web_view
+    
+    def _sender_container(self):
+        """返回发出信号的标题栏按钮所在的容器"""
+        widget = self.sender()
+        while widget is not None and not isinstance(widget, AIContainer):
+            widget = widget.parentWidget()
+        return widget
+    
+    # 标题栏按钮的槽：所有容器共用同一组绑定方法，通过sender()找到所属容器
+    @pyqtSlot()
+    def _on_highlight_btn_clicked(self):
+        self.show_highlights(self._sender_container())
+    
+    @pyqtSlot()
+    def _on_move_left_clicked(self):
+        self.move_view_left(self._sender_container())
+    
+    @pyqtSlot()
+    def _on_move_right_clicked(self):
+        self.move_view_right(self._sender_container())
+    
+    @pyqtSlot()
+    def _on_refresh_clicked(self):
+        self.refresh_view(self._sender_container())
+    
+    @pyqtSlot()
+    def _on_maximize_clicked(self):
+        self.toggle_maximize_view(self._sender_container(), self.sender())
+    
+    @pyqtSlot()
+    def _on_add_clicked(self):
+        self.add_view_after(self._sender_container())
+    
+    @pyqtSlot()
+    def _on_close_clicked(self):
+        self.close_view(self._sender_container())
+    
+    def _create_container_web_view(self, container):
+        """为容器创建延迟加载的网页视图
+        
+        Args:
+            container: 尚未创建网页视图的容器
+            
+        Returns:
+            AIWebView: 容器的网页视图
+        """
+        ai_config = container.pending_config
+        if ai_config is None:
+            return container.web_view
+        container.pending_config = None
+        
+        web_view = self._acquire_web_view(ai_config, self._next_load_delay())
+        
+        # 添加到容器并存储
+        container.layout().addWidget(web_view)
+        web_view.show()
+        container.web_view = web_view  # 将web_view作为容器的属性存储
+        self.logger.debug("已为容器创建网页视图: %s", web_view.ai_name)
         
-        # 启动高亮计数更新
-        QTimer.singleShot(1000, lambda: self.update_highlight_count(container))
+        # 启动高亮计数更新（短时间内新增的多个视图合并为一次定时器触发）
+        self._pending_highlight_update.append(container)
+        self._highlight_update_timer.start()
         
         return web_view
     
+    def ensure_web_views(self):
+        """为所有尚未显示过的容器创建网页视图
+        
+        在需要向全部视图发送内容（例如窗口隐藏时同步提示词）之前调用。
+        """
+        for i in range(self.splitter.count()):
+            container = self.splitter.widget(i)
+            if container.pending_config is not None:
+                self._create_container_web_view(container)
+    
     def add_ai_web_view(self, ai_name, ai_url, input_selector=None, submit_selector=None):
         """添加AI网页视图 (兼容旧接口)
         
@@ -1006,11 +1469,9 @@ class AIView(QWidget):
             submit_selector (str): 提交按钮选择器
         """
         # 查找匹配的AI平台配置
-        ai_config = None
-        for key, config in SUPPORTED_AI_PLATFORMS.items():
-            if config["name"] == ai_name:
-                ai_config = config.copy()
-                break
+        ai_config = _PLATFORM_BY_NAME.get(ai_name)
+        if ai_config:
+            ai_config = ai_config.copy()
         
         # 如果没有找到匹配的配置，创建一个新的
         if not ai_config:
@@ -1031,6 +1492,17 @@ class AIView(QWidget):
         
         return self.add_ai_web_view_from_config(ai_config)
     
+    @contextmanager
+    def _batch_splitter_updates(self):
+        """批量修改分割器期间暂停重绘并屏蔽分割器信号，结束后统一刷新一次"""
+        self.splitter.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self.splitter)
+        try:
+            yield
+        finally:
+            blocker.unblock()
+            self.splitter.setUpdatesEnabled(True)
+    
     def adjust_splitter_sizes(self):
         """调整分割器各部分的宽度比例"""
         count = self.splitter.count()
@@ -1039,14 +1511,51 @@ class AIView(QWidget):
             sizes = [width // count] * count
             self.splitter.setSizes(sizes)
     
+    def _schedule_refresh(self, adjust_sizes=True):
+        """安排一次延迟刷新，短时间内的多次调用合并为一次
+        
+        Args:
+            adjust_sizes (bool): 是否同时重新均分分割器宽度
+        """
+        if adjust_sizes:
+            self._refresh_sizes_pending = True
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+    
+    @pyqtSlot()
+    def _do_refresh(self):
+        """执行合并后的分割器宽度调整和导航按钮更新"""
+        if self._refresh_sizes_pending:
+            self._refresh_sizes_pending = False
+            self.adjust_splitter_sizes()
+        self.update_navigation_buttons()
+    
+    @property
+    def ai_web_views(self):
+        """各容器中已创建的网页视图 {ai_key: web_view}，按分割器从左到右的顺序排列
+        
+        直接由容器状态生成，网页视图只由容器持有，不再另外维护一份字典。
+        """
+        views = {}
+        splitter = self.splitter
+        for i in range(splitter.count()):
+            container = splitter.widget(i)
+            if container.web_view is not None:
+                views[container.ai_key] = container.web_view
+        return views
+    
     def fill_prompt(self, prompt_text):
         """向所有AI网页填充提示词
         
         Args:
             prompt_text (str): 提示词文本
         """
+        self.ensure_web_views()
+        
+        # 提示词只编码一次，所有视图共用同一段脚本
+        js_code = build_inject_prompt_script(prompt_text)
         for web_view in self.ai_web_views.values():
-            web_view.fill_prompt(prompt_text)
+            web_view.run_prompt_script(js_code)
             
     def collect_all_responses(self, callback):
         """收集所有AI网页视图的响应信息
@@ -1057,44 +1566,50 @@ class AIView(QWidget):
             callback: 回调函数，接收由各WebView返回的信息组成的列表
                      每项包含url和reply字段
         """
-        responses = []
-        pending_count = len(self.ai_web_views)
-        
-        if pending_count == 0:
+        web_view_list = list(self.ai_web_views.items())
+        if not web_view_list:
             # 如果没有WebView，立即返回空列表
             callback([])
             return
         
-        def response_collected(result, web_view_key):
-            """单个响应收集完成的回调"""
-            nonlocal responses, pending_count
-            
-            # 添加响应到列表
-            if result:
-                responses.append(result)
-            else:
-                # 如果获取失败，添加一个包含URL但没有回复的项
-                web_view = self.ai_web_views[web_view_key]
-                responses.append({
-                    "url": web_view.url().toString(),
-                    "reply": "无法获取回复内容"
-                })
-            
-            # 减少待处理计数
-            pending_count -= 1
-            
-            # 如果所有WebView都已处理完成，调用总回调
-            if pending_count == 0:
-                callback(responses)
+        # 本次收集的状态，由各个回调共享；结果按视图顺序预留位置，回调先后不影响顺序
+        state = {
+            "pending": len(web_view_list),
+            "responses": [None] * len(web_view_list),
+            "callback": callback
+        }
         
-        # 遍历所有WebView，获取响应
-        for key, web_view in self.ai_web_views.items():
-            web_view.get_prompt_response(lambda result, k=key: response_collected(result, k))
+        # 遍历所有WebView，获取响应（每个视图一次调用同时取回URL和回复）
+        for slot, (key, web_view) in enumerate(web_view_list):
+            web_view.get_prompt_response(partial(self._on_response_collected, state, slot, web_view))
     
-    def resizeEvent(self, event):
-        """窗口大小变化时调整分割器各部分的宽度比例"""
-        super().resizeEvent(event)
-        self.adjust_splitter_sizes()
+    def _on_response_collected(self, state, slot, web_view, result):
+        """单个响应收集完成的回调
+        
+        Args:
+            state (dict): 本次收集的共享状态(pending/responses/callback)
+            slot (int): 该视图结果在响应列表中的位置
+            web_view (AIWebView): 返回结果的网页视图
+            result: JavaScript返回的响应信息
+        """
+        # 写入该视图对应的位置
+        if result:
+            state["responses"][slot] = result
+        else:
+            # 如果获取失败，填入一个包含URL但没有回复的项
+            state["responses"][slot] = {
+                "url": web_view.current_url,
+                "reply": "无法获取回复内容"
+            }
+        
+        # 减少待处理计数，全部完成后调用总回调
+        state["pending"] -= 1
+        if state["pending"] == 0:
+            state["callback"](state["responses"])
+    
+    def _on_ai_changed_slot(self, container, selector, index):
+        """下拉框currentIndexChanged信号的槽，容器和下拉框通过partial预先绑定"""
+        self.on_ai_changed(container, index, selector)
     
     def on_ai_changed(self, container, index, selector):
         """处理AI平台选择变更
@@ -1112,72 +1627,129 @@ class AIView(QWidget):
              self.logger.error(f"从下拉菜单获取的AI key无效或类型错误 (index={index}, data={ai_key})")
              return
         
-        self.logger.debug(f"接收到AI平台变更信号: index={index}, key='{ai_key}'")
+        self.logger.debug("接收到AI平台变更信号: index=%s, key='%s'", index, ai_key)
         
         # 避免重复加载同一个平台
-        if hasattr(container, 'ai_key') and container.ai_key == ai_key:
-            self.logger.debug(f"AI平台未变化('{ai_key}')，无需切换")
+        if container.ai_key == ai_key:
+            self.logger.debug("AI平台未变化('%s')，无需切换", ai_key)
             return
         
-        # 获取AI平台配置 (使用小写 key 从 SUPPORTED_AI_PLATFORMS 查找)
-        # 注意：SUPPORTED_AI_PLATFORMS 的键是大写的，值里面的 'key' 是小写的
-        ai_config = None
-        for dict_key, platform_config in SUPPORTED_AI_PLATFORMS.items():
-            if platform_config.get("key") == ai_key:
-                ai_config = platform_config
-                self.logger.debug(f"找到匹配的AI平台配置: {ai_key} (原字典键: '{dict_key}')")
-                break
-        
+        # 获取AI平台配置 (SUPPORTED_AI_PLATFORMS 的键是大写的，这里按值里面的小写 key 索引)
+        ai_config = _PLATFORM_BY_KEY.get(ai_key)
         if not ai_config:
             self.logger.error(f"在SUPPORTED_AI_PLATFORMS中找不到key='{ai_key}'的配置")
             return
         
         self.logger.info(f"准备切换到AI平台: {ai_config['name']}")
         
-        # 保存旧的web_view引用以便稍后删除
-        old_web_view = None
-        if hasattr(container, 'web_view'):
-            old_web_view = container.web_view
-            self.logger.debug(f"找到旧的WebView实例: {old_web_view.ai_name}")
+        # 切换平台后不再需要延迟创建原平台的网页视图
+        container.pending_config = None
+        
+        # 保存旧的web_view引用以便放回视图池
+        old_web_view = container.web_view
+        if old_web_view is not None:
+            self.logger.debug("找到旧的WebView实例: %s", old_web_view.ai_name)
+            
+            # 新平台与当前页面地址相同时直接沿用当前视图，避免重新加载页面
+            if old_web_view.url() == QUrl(ai_config["url"]):
+                old_web_view.switch_platform(ai_config)
+                container.ai_key = ai_key
+                self.logger.info(f"目标平台地址与当前页面相同，沿用现有视图: {ai_config['name']}")
+                return
         
-        # 创建新的web_view
-        web_view = AIWebView(ai_config) # 使用找到的 config 创建
+        web_view = self._acquire_web_view(ai_config)
         
         # 替换容器中的web_view
         layout = container.layout()
         if old_web_view:
-            # 移除旧的web_view
-            layout.removeWidget(old_web_view)
-            self.logger.debug(f"从布局中移除旧WebView ({old_web_view.ai_name})")
-            old_web_view.setParent(None) # 解除父子关系，确保能被删除
-            old_web_view.deleteLater()
-            self.logger.debug(f"标记旧WebView ({old_web_view.ai_name})为待删除")
-            
-            # 从字典中移除旧的引用 (使用旧的 key)
+            # 在布局中原位替换旧的web_view，只触发一次重新布局，再把旧视图放入视图池
             old_key = container.ai_key # 获取旧的key
-            if old_key in self.ai_web_views and self.ai_web_views[old_key] == old_web_view:
-                del self.ai_web_views[old_key]
-                self.logger.debug(f"从ai_web_views字典中移除旧引用 (key: '{old_key}')")
-            else:
-                self.logger.warning(f"在ai_web_views中找不到/无法移除旧引用 (key: '{old_key}')")
+            layout.replaceWidget(old_web_view, web_view)
+            self.logger.debug("在布局中用新WebView替换旧WebView (%s)", old_web_view.ai_name)
+            self._release_web_view(old_key, old_web_view)
         else:
             self.logger.warning("容器中未找到旧WebView引用")
+            layout.addWidget(web_view)
         
-        # 添加新的web_view
-        layout.addWidget(web_view)
-        self.logger.debug(f"添加新WebView ({web_view.ai_name})到布局")
+        web_view.show()
+        self.logger.debug("新WebView (%s)已加入布局", web_view.ai_name)
         
         # 更新容器的属性
         container.web_view = web_view
         container.ai_key = ai_key # 更新为新的小写 key
-        self.logger.debug(f"更新容器属性为新平台 (key: '{ai_key}')")
-        
-        # 更新web_view字典 (使用新的小写 key)
-        self.ai_web_views[ai_key] = web_view
-        self.logger.debug(f"更新ai_web_views字典添加新引用 (key: '{ai_key}')")
+        self.logger.debug("更新容器属性为新平台 (key: '%s')", ai_key)
         
         self.logger.info(f"成功切换到AI平台: {ai_config['name']}")
     
+    def _next_load_delay(self):
+        """计算新建视图的加载延迟，同时显示的多个视图依次间隔启动，避免同时争用网络和CPU
+        
+        Returns:
+            int: 延迟毫秒数，距上一个视图开始加载已足够久时为0
+        """
+        now = time.monotonic()
+        start = max(now, self._next_load_time)
+        self._next_load_time = start + WEB_VIEW_LOAD_STAGGER_MS / 1000
+        return int((start - now) * 1000)
+    
+    def _acquire_web_view(self, ai_config, load_delay=0):
+        """获取用于指定平台的网页视图
+        
+        优先复用视图池中同一平台的视图；视图池已满时回收最久未使用的视图改载新平台，
+        避免销毁一个渲染进程再新建一个；否则创建新视图。
+        
+        Args:
+            ai_config (dict): AI平台配置
+            load_delay (int): 新建视图时延迟加载页面的毫秒数
+            
+        Returns:
+            AIWebView: 可直接放入容器的网页视图
+        """
+        web_view = self._web_view_pool.pop(ai_config["key"], None)
+        if web_view is not None:
+            self.logger.debug("从视图池复用WebView (%s)", web_view.ai_name)
+            # 同一平台但指定了其他地址（如打开历史对话）时，在复用的视图中加载该地址
+            if web_view.ai_url != ai_config["url"]:
+                web_view.reconfigure(ai_config)
+            web_view.resume_monitors()
+            return web_view
+        
+        if len(self._web_view_pool) >= WEB_VIEW_POOL_SIZE:
+            evicted_key, web_view = self._web_view_pool.popitem(last=False)
+            self.logger.debug("回收视图池中的WebView (key: '%s')用于 %s", evicted_key, ai_config["name"])
+            web_view.reconfigure(ai_config)
+            web_view.resume_monitors()
+            return web_view
+        
+        web_view = AIWebView(ai_config, self._shared_profile, load_delay)
+        self._connect_web_view(web_view)
+        return web_view
+    
+    def _release_web_view(self, ai_key, web_view):
+        """将换下的网页视图放入视图池，超出上限时销毁最久未使用的视图
+        
+        Args:
+            ai_key (str): 网页视图对应的AI平台标识
+            web_view (AIWebView): 换下的网页视图
+        """
+        # 挂到AIView下隐藏保存，生命周期随AIView结束；闲置期间停止轮询，
+        # 也避免隐藏的视图抢先取走发给可见视图的剪贴板高亮数据
+        web_view.hide()
+        web_view.setParent(self)
+        web_view.pause_monitors()
+        
+        # 同一平台只保留最近换下的一个视图
+        stale = self._web_view_pool.pop(ai_key, None)
+        if stale is not None:
+            stale.deleteLater()
+        self._web_view_pool[ai_key] = web_view
+        self.logger.debug(f"WebView ({web_view.ai_name}) 已放入视图池")
+        
+        while len(self._web_view_pool) > WEB_VIEW_POOL_SIZE:
+            evicted_key, evicted = self._web_view_pool.popitem(last=False)
+            evicted.deleteLater()
+            self.logger.debug(f"视图池已满，销毁WebView (key: '{evicted_key}')")
+    
     def move_view_left(self, container):
         """将视图向左移动一个位置
         
@@ -1186,24 +1758,12 @@ class AIView(QWidget):
         """
         index = self.splitter.indexOf(container)
         if index > 0:  # 如果不是最左侧的视图
-            # 获取左侧视图
-            left_widget = self.splitter.widget(index - 1)
-            
-            # 记住当前的大小
-            sizes = self.splitter.sizes()
-            left_size = sizes[index - 1]
-            current_size = sizes[index]
-            
-            # 移除并重新插入容器
-            self.splitter.insertWidget(index - 1, container)
-            
-            # 恢复大小
-            sizes[index - 1] = current_size
-            sizes[index] = left_size
-            self.splitter.setSizes(sizes)
-            
-            # 更新导航按钮状态
-            self.update_navigation_buttons()
+            with self._batch_splitter_updates():
+                # 重新插入容器；分割器的尺寸记录随控件一起移动，交换后各视图保持原有宽度
+                self.splitter.insertWidget(index - 1, container)
+                
+                # 更新导航按钮状态（保留交换后的大小，不重新均分）
+                self._schedule_refresh(adjust_sizes=False)
     
     def move_view_right(self, container):
         """将视图向右移动一个位置
@@ -1213,24 +1773,12 @@ class AIView(QWidget):
         """
         index = self.splitter.indexOf(container)
         if index < self.splitter.count() - 1:  # 如果不是最右侧的视图
-            # 获取右侧视图
-            right_widget = self.splitter.widget(index + 1)
-            
-            # 记住当前的大小
-            sizes = self.splitter.sizes()
-            right_size = sizes[index + 1]
-            current_size = sizes[index]
-            
-            # 移除并重新插入容器
-            self.splitter.insertWidget(index + 1, container)
-            
-            # 恢复大小
-            sizes[index] = right_size
-            sizes[index + 1] = current_size
-            self.splitter.setSizes(sizes)
-            
-            # 更新导航按钮状态
-            self.update_navigation_buttons()
+            with self._batch_splitter_updates():
+                # 重新插入容器；分割器的尺寸记录随控件一起移动，交换后各视图保持原有宽度
+                self.splitter.insertWidget(index + 1, container)
+                
+                # 更新导航按钮状态（保留交换后的大小，不重新均分）
+                self._schedule_refresh(adjust_sizes=False)
     
     def refresh_view(self, container):
         """刷新视图
@@ -1238,7 +1786,7 @@ class AIView(QWidget):
         Args:
             container: 包含web_view的容器
         """
-        if hasattr(container, 'web_view'):
+        if container.web_view is not None:
             container.web_view.reload()
     
     def toggle_maximize_view(self, container, button):
@@ -1248,33 +1796,29 @@ class AIView(QWidget):
             container: 包含web_view的容器
             button: 最大化/恢复按钮
         """
-        # 获取所有视图容器
-        containers = []
-        for i in range(self.splitter.count()):
-            containers.append(self.splitter.widget(i))
+        maximize = not container.is_maximized
         
-        theme_colors = self.theme_manager.get_current_theme_colors() if self.theme_manager else {}
-        icon_color = theme_colors.get('foreground', '#D8DEE9') # 获取当前主题的前景色
+        # 最大化时隐藏其他视图，恢复时重新显示，直接遍历分割器无需构建列表
+        splitter = self.splitter
+        for i in range(splitter.count()):
+            widget = splitter.widget(i)
+            if widget is not container:
+                widget.setVisible(not maximize)
+        
+        icon_color = self._current_theme_colors().get('foreground', '#D8DEE9') # 获取当前主题的前景色
             
-        if not container.is_maximized:
-            # 最大化：隐藏其他视图，调整当前视图为全宽
-            for c in containers:
-                if c != container:
-                    c.hide()
+        if maximize:
             # 更新按钮图标为"恢复"
-            button.setIcon(qta.icon("fa5s.compress", color=icon_color))
+            button.setIcon(_cached_qta_icon("fa5s.compress", icon_color))
             button.setToolTip("恢复视图大小")
             container.is_maximized = True
         else:
-            # 恢复：显示所有视图，重新调整宽度
-            for c in containers:
-                c.show()
             # 更新按钮图标为"最大化"
-            button.setIcon(qta.icon("fa5s.expand", color=icon_color))
+            button.setIcon(_cached_qta_icon("fa5s.expand", icon_color))
             button.setToolTip("最大化此视图")
             container.is_maximized = False
             # 重新调整所有视图大小
-            self.adjust_splitter_sizes()
+            self._schedule_refresh()
     
     def add_view_after(self, container):
         """在当前视图右侧添加新视图
@@ -1289,32 +1833,25 @@ class AIView(QWidget):
         
         # 如果有可用的AI平台，则添加第一个
         if enabled_platforms:
-            # 创建新视图
-            new_view = self.add_ai_web_view_from_config(enabled_platforms[0])
-            
-            # 将新视图移动到当前视图右侧
-            new_container = None
-            for i in range(self.splitter.count()):
-                widget = self.splitter.widget(i)
-                if hasattr(widget, 'web_view') and widget.web_view == new_view:
-                    new_container = widget
-                    break
-            
-            if new_container:
-                # 移动到当前视图右侧
-                current_index = self.splitter.indexOf(new_container)
-                if current_index != index + 1:
-                    # 记住当前的大小
-                    sizes = self.splitter.sizes()
-                    
-                    # 移除并重新插入
-                    self.splitter.insertWidget(index + 1, new_container)
-                    
-                    # 重新调整大小
-                    self.adjust_splitter_sizes()
-                    
-                    # 更新导航按钮状态
-                    self.update_navigation_buttons()
+            with self._batch_splitter_updates():
+                # 创建新视图
+                self.add_ai_web_view_from_config(enabled_platforms[0])
+                
+                # 将新视图移动到当前视图右侧（新容器总是追加在最后）
+                new_container = self.splitter.widget(self.splitter.count() - 1)
+                
+                if new_container:
+                    # 移动到当前视图右侧
+                    current_index = self.splitter.indexOf(new_container)
+                    if current_index != index + 1:
+                        # 记住当前的大小
+                        sizes = self.splitter.sizes()
+                        
+                        # 移除并重新插入
+                        self.splitter.insertWidget(index + 1, new_container)
+                        
+                        # 重新调整大小并更新导航按钮状态
+                        self._schedule_refresh()
     
     def close_view(self, container):
         """关闭视图
@@ -1331,28 +1868,17 @@ class AIView(QWidget):
         if self.splitter.count() <= 1:
             return
         
-        # 获取AI key，从字典中移除
-        if hasattr(container, 'ai_key'):
-            ai_key = container.ai_key
-            if ai_key in self.ai_web_views:
-                del self.ai_web_views[ai_key]
-        
-        # 从分割器中移除
-        container.setParent(None)
-        
-        # 如果当前是最大化状态，恢复其他视图
-        if hasattr(container, 'is_maximized') and container.is_maximized:
-            for i in range(self.splitter.count()):
-                self.splitter.widget(i).show()
-        
-        # 调整剩余视图的大小
-        self.adjust_splitter_sizes()
-        
-        # 更新导航按钮状态
-        self.update_navigation_buttons()
-        
-        # 标记为稍后删除
-        container.deleteLater()
+        with self._batch_splitter_updates():
+            # 从分割器中移除并销毁容器，已创建的网页视图放入视图池
+            self._discard_container(container)
+            
+            # 如果当前是最大化状态，恢复其他视图
+            if container.is_maximized:
+                for i in range(self.splitter.count()):
+                    self.splitter.widget(i).show()
+            
+            # 调整剩余视图的大小并更新导航按钮状态
+            self._schedule_refresh()
     
     def update_navigation_buttons(self):
         """更新所有容器的导航按钮状态（左右移动按钮）"""
@@ -1363,11 +1889,11 @@ class AIView(QWidget):
             container = self.splitter.widget(i)
             
             # 对于最左侧的容器，隐藏向左按钮
-            if hasattr(container, 'move_left_btn'):
+            if container.move_left_btn is not None:
                 container.move_left_btn.setVisible(i > 0)
             
             # 对于最右侧的容器，隐藏向右按钮
-            if hasattr(container, 'move_right_btn'):
+            if container.move_right_btn is not None:
                 container.move_right_btn.setVisible(i < count - 1)
     
     def open_multiple_urls(self, urls):
@@ -1382,87 +1908,49 @@ class AIView(QWidget):
             
         self.logger.info(f"打开URLs请求: {urls}")
         
-        # 清空现有视图
-        for i in range(self.splitter.count()):
-            widget = self.splitter.widget(0)
-            widget.setParent(None)
-        
-        self.ai_web_views.clear()
-        
-        # 为每个URL创建一个新的网页视图
-        for url in urls:
-            # 从URL分析AI平台
-            from urllib.parse import urlparse
-            domain = urlparse(url).netloc
-            if domain.startswith('www.'):
-                domain = domain[4:]
-                
-            # URL到平台标识的映射
-            url_to_platform = {
-                'chat.openai.com': 'chatgpt',
-                'chatgpt.com': 'chatgpt',
-                'kimi.moonshot.cn': 'kimi',
-                'doubao.com': 'doubao',
-                'perplexity.ai': 'perplexity',
-                'n.cn': 'n',
-                'metaso.cn': 'metaso',
-                'chatglm.cn': 'chatglm',
-                'yuanbao.tencent.com': 'yuanbao',
-                'biji.com': 'biji',
-                'x.com': 'grok',
-                'grok.com': 'grok',
-                'yiyan.baidu.com': 'yiyan',
-                'tongyi.aliyun.com': 'tongyi',
-                'gemini.google.com': 'gemini',
-                'chat.deepseek.com': 'deepseek',
-                'claude.ai': 'claude',
-                'anthropic.com': 'claude',
-                'bing.com': 'bing'
-            }
+        with self._batch_splitter_updates():
+            # 清空现有视图
+            for container in [self.splitter.widget(i) for i in range(self.splitter.count())]:
+                self._discard_container(container)
             
-            # 根据域名获取平台标识
-            ai_key = url_to_platform.get(domain)
-            
-            # 如果找不到精确匹配，尝试部分匹配
-            if not ai_key:
-                for host, key in url_to_platform.items():
-                    if host in domain:
-                        ai_key = key
-                        break
-            
-            # 如果无法识别平台，使用通用配置
-            if not ai_key:
-                ai_key = "unknown"
-                ai_name = "未知平台"
-                self.logger.warning(f"无法识别URL域名: {domain}")
-            else:
-                # 查找匹配的AI平台配置
-                ai_name = None
-                for key, config in SUPPORTED_AI_PLATFORMS.items():
-                    if config["key"] == ai_key:
-                        ai_name = config["name"]
-                        break
+            # 为每个URL创建一个新的网页视图
+            for url in urls:
+                # 从URL分析AI平台
+                host_match = _HOST_RE.match(url)
+                domain = host_match.group(1).lower() if host_match else ''
                 
-                if not ai_name:
-                    ai_name = ai_key.capitalize()  # 如果找不到名称，使用key的首字母大写形式
-                    self.logger.debug(f"未找到{ai_key}的平台名称，使用首字母大写形式")
-            
-            # 创建配置
-            ai_config = {
-                "key": ai_key,
-                "name": ai_name,
-                "url": url,
-                "input_selector": "",  # 不需要输入选择器，只是查看
-                "submit_selector": "",
-                "response_selector": ""
-            }
+                # 根据域名获取平台标识，找不到精确匹配时按域名后缀匹配
+                ai_key = _URL_TO_PLATFORM.get(domain) or _match_platform_by_domain(domain)
+                
+                # 如果无法识别平台，使用通用配置
+                if not ai_key:
+                    ai_key = "unknown"
+                    ai_name = "未知平台"
+                    self.logger.warning(f"无法识别URL域名: {domain}")
+                else:
+                    # 查找匹配的AI平台名称
+                    platform_config = _PLATFORM_BY_KEY.get(ai_key)
+                    ai_name = platform_config["name"] if platform_config else None
+                    if not ai_name:
+                        ai_name = ai_key.capitalize()  # 如果找不到名称，使用key的首字母大写形式
+                        self.logger.debug(f"未找到{ai_key}的平台名称，使用首字母大写形式")
+                
+                # 创建配置
+                ai_config = {
+                    "key": ai_key,
+                    "name": ai_name,
+                    "url": url,
+                    "input_selector": "",  # 不需要输入选择器，只是查看
+                    "submit_selector": "",
+                    "response_selector": ""
+                }
+                
+                self.logger.debug(f"为URL创建AI视图: {url} -> {ai_name}")
+                # 添加网页视图
+                self.add_ai_web_view_from_config(ai_config)
             
-            self.logger.debug(f"为URL创建AI视图: {url} -> {ai_name}")
-            # 添加网页视图
-            self.add_ai_web_view_from_config(ai_config)
-        
-        # 调整视图大小
-        self.adjust_splitter_sizes()
+            # 调整视图大小
+            self._schedule_refresh()
 
     def show_highlights(self, container):
         """显示当前页面的所有高亮内容
@@ -1470,11 +1958,11 @@ class AIView(QWidget):
         Args:
             container: 包含web_view的容器
         """
-        if not hasattr(container, 'web_view'):
+        if container.web_view is None:
             return
             
         web_view = container.web_view
-        current_url = web_view.url().toString()
+        current_url = web_view.current_url
         
         # 获取当前URL的高亮数据
         highlights = self.db_manager.get_highlights_for_url(current_url)
@@ -1482,49 +1970,19 @@ class AIView(QWidget):
         if not highlights:
             return
         
-        # 获取高亮按钮的全局位置
-        highlight_btn_pos = container.highlight_btn.mapToGlobal(container.highlight_btn.rect().bottomLeft())
-        
-        # 获取WebView在屏幕上的位置和尺寸，用于确保对话框不会被遮挡
-        webview_rect = web_view.rect()
-        webview_global_pos = web_view.mapToGlobal(webview_rect.topLeft())
-        webview_width = webview_rect.width()
+        # 获取高亮按钮的全局位置，以及WebView在屏幕上的位置和宽度，用于确保对话框不会被遮挡
+        highlight_btn_pos, webview_global_pos, webview_width = container.popup_anchor()
         
         # 创建高亮显示对话框 - 使用无边框窗口
         dialog = QDialog(self)
         dialog.setWindowFlags(Qt.WindowType.Popup | Qt.WindowType.FramelessWindowHint | Qt.WindowType.NoDropShadowWindowHint)
         dialog.setMinimumWidth(350)
         dialog.setMaximumWidth(450)
-        # QDialog本身无边框、透明
-        dialog.setStyleSheet("QDialog { background: transparent; border: none; }")
+        # 对话框及其子控件的样式集中在一份样式表中，只解析一次
+        dialog.setStyleSheet(_HIGHLIGHT_DIALOG_STYLE)
 
         # 外层QFrame作为内容容器，带边框
         border_frame = QFrame(dialog)
-        border_frame.setStyleSheet("""
-            QFrame {
-                background-color: #FFFFFF;
-                border: 1px solid #E0E0E0;
-                border-radius: 0px;
-            }
-            QScrollBar:vertical {
-                width: 4px;
-                background: #F5F5F5;
-                margin: 0px 0px 0px 0px;
-                border: none;
-                border-radius: 2px;
-            }
-            QScrollBar::handle:vertical {
-                background: #C0C0C0;
-                min-height: 20px;
-                border-radius: 2px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """)
         border_layout = QVBoxLayout(border_frame)
         border_layout.setContentsMargins(0, 0, 0, 0)
         border_layout.setSpacing(0)
@@ -1532,14 +1990,12 @@ class AIView(QWidget):
         # 标题栏容器
         title_container = QWidget()
         title_container.setObjectName("titleContainer")
-        title_container.setStyleSheet("background-color: #F7F7F7; border-top-left-radius: 0px; border-top-right-radius: 0px;")
         title_layout = QHBoxLayout(title_container)
         title_layout.setContentsMargins(10, 5, 10, 5)
         
         # 添加标题
         title_label = QLabel(f"页面高亮内容 ({len(highlights)})")
         title_label.setObjectName("titleLabel")
-        title_label.setStyleSheet("background-color: transparent; border: none; color: #000000;")
         title_layout.addWidget(title_label)
         
         # 添加复制按钮
@@ -1548,11 +2004,9 @@ class AIView(QWidget):
         copy_btn.setToolTip("复制所有高亮内容到剪贴板")
         copy_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         # 设置图标（使用qtawesome的复制图标）
-        import qtawesome as qta
-        copy_btn.setIcon(qta.icon('fa5s.copy', color='#0066CC'))
+        copy_btn.setIcon(_cached_qta_icon('fa5s.copy', '#0066CC'))
         copy_btn.setIconSize(QSize(16, 16))
         copy_btn.setFixedSize(28, 28)
-        copy_btn.setStyleSheet("border: none; background: transparent; padding: 0px; margin-left: 6px;")
         title_layout.addWidget(copy_btn)
         
         # 复制按钮点击事件
@@ -1579,73 +2033,45 @@ class AIView(QWidget):
         # 添加标题栏到主布局
         border_layout.addWidget(title_container)
         
-        # 创建列表部件
-        list_widget = QListWidget()
-        list_widget.setAlternatingRowColors(False)
-        list_widget.setVerticalScrollMode(QListWidget.ScrollMode.ScrollPerPixel)
-        list_widget.setSpacing(10)  # 增加项之间的间距
-        list_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        list_widget.setSizeAdjustPolicy(QListWidget.SizeAdjustPolicy.AdjustToContents)
-        list_widget.setWordWrap(True)
-        list_widget.setMaximumWidth(440)
+        # 创建列表视图，由代理直接绘制各项
+        list_view = QListView()
+        list_view.setAlternatingRowColors(False)
+        list_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        list_view.setSpacing(10)  # 增加项之间的间距
+        list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        list_view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        list_view.setMouseTracking(True)  # 用于绘制悬停效果
+        list_view.setMaximumWidth(440)
+        
+        # 预先计算文本度量，避免逐项触发布局计算
+        # 文本可用宽度 = 列表宽度 - 颜色条(4) - 左右内边距(14*2) - 两侧项间距
+        text_width = list_view.maximumWidth() - 4 - 28 - 2 * list_view.spacing()
+        text_font = QFont(list_view.font())
+        text_font.setPixelSize(13)
+        text_metrics = QFontMetrics(text_font)
+        list_view.setItemDelegate(HighlightItemDelegate(text_font, list_view))
         
         # 添加高亮项
-        for idx, highlight in enumerate(highlights):
-            item = QListWidgetItem()
-            item_widget = QWidget()
-            item_layout = QHBoxLayout(item_widget)
-            item_layout.setContentsMargins(0, 0, 0, 0)
-            item_layout.setSpacing(0)
-            highlight_type = highlight.get('highlight_type', 'yellow')
-            color_map = {
-                'yellow': '#FFC107',
-                'green': '#4CAF50',
-                'red': '#F44336',
-                'blue': '#03A9F4',
-                'purple': '#9C27B0',
-                'pink': '#E91E63'
-            }
-            border_color = color_map.get(highlight_type, '#FFC107')
-            color_bar = QLabel()
-            color_bar.setFixedWidth(4)
-            color_bar.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Expanding)
-            color_bar.setStyleSheet(f"background-color: {border_color}; border-radius: 0px;")
-            item_layout.addWidget(color_bar)
-            # 内容卡片无边框、无圆角，底部分割线
-            content_widget = QWidget()
-            if idx < len(highlights) - 1:
-                content_widget.setStyleSheet("background-color: #FFFFFF; border: none; border-radius: 0px; border-bottom: 1px solid #F0F0F0;")
-            else:
-                content_widget.setStyleSheet("background-color: #FFFFFF; border: none; border-radius: 0px;")
-            content_layout = QVBoxLayout(content_widget)
-            content_layout.setContentsMargins(14, 12, 14, 12)
-            content_layout.setSpacing(0)
+        model = QStandardItemModel(list_view)
+        row_heights = []  # 记录各项高度，用于计算对话框高度
+        for highlight in highlights:
             text_content = highlight.get('text_content', '')
-            text_label = QLabel(text_content)
-            text_label.setWordWrap(True)
-            text_label.setStyleSheet("""
-                QLabel {
-                    background-color: transparent;
-                    font-size: 13px;
-                    line-height: 1.5;
-                    color: #000000;
-                }
-            """)
-            content_layout.addWidget(text_label)
-            item_layout.addWidget(content_widget, 1)
-            text_height = text_label.sizeHint().height()
+            text_height = text_metrics.boundingRect(
+                QRect(0, 0, text_width, 0), _HIGHLIGHT_TEXT_FLAGS, text_content
+            ).height()
             min_height = max(text_height + 24, 54)
-            item_widget.setMinimumHeight(min_height)
-            item.setSizeHint(content_widget.sizeHint())
-            item.setData(Qt.ItemDataRole.UserRole, highlight)
-            list_widget.addItem(item)
-            list_widget.setItemWidget(item, item_widget)
+            row_heights.append(min_height)
+            item = QStandardItem(text_content)
+            item.setSizeHint(QSize(text_width + 32, min_height))
+            item.setData(highlight, Qt.ItemDataRole.UserRole)
+            model.appendRow(item)
+        list_view.setModel(model)
         
         # 连接列表项点击信号
-        list_widget.itemClicked.connect(lambda item: self.scroll_to_highlight(web_view, item.data(Qt.ItemDataRole.UserRole)))
+        list_view.clicked.connect(lambda index: self.scroll_to_highlight(web_view, index.data(Qt.ItemDataRole.UserRole)))
         
         # 添加部件到布局
-        border_layout.addWidget(list_widget)
+        border_layout.addWidget(list_view)
         
         # QDialog只加QFrame
         dialog_layout = QVBoxLayout(dialog)
@@ -1654,12 +2080,10 @@ class AIView(QWidget):
         dialog_layout.addWidget(border_frame)
         
         # 调整对话框高度，确保高亮条目有足够的空间显示
+        # 各项高度随文本变化，直接累加构建时已算好的高度
         max_items = min(5, len(highlights))
-        total_item_height = 0
-        for i in range(min(max_items, list_widget.count())):
-            item = list_widget.item(i)
-            height = item.sizeHint().height()
-            total_item_height += height + list_widget.spacing()
+        spacing = list_view.spacing()
+        total_item_height = sum(height + spacing for height in row_heights[:max_items])
         title_height = title_container.sizeHint().height()
         dialog_height = title_height + total_item_height + 30
         dialog_height = max(dialog_height, 220)
@@ -1672,26 +2096,11 @@ class AIView(QWidget):
         webview_center_x = webview_global_pos.x() + webview_width // 2
         dialog_x = webview_center_x - dialog_width // 2
         dialog_y = highlight_btn_pos.y()
-        screen = None
-        for screen_obj in QApplication.screens():
-            screen_geometry = screen_obj.geometry()
-            if screen_geometry.contains(webview_global_pos):
-                screen = screen_obj
-                break
-        if not screen:
-            for screen_obj in QApplication.screens():
-                screen_geometry = screen_obj.geometry()
-                if screen_geometry.contains(highlight_btn_pos):
-                    screen = screen_obj
-                    break
+        # 依次按WebView、高亮按钮、主窗口所在位置确定屏幕，都找不到时使用主屏幕
+        screen = QApplication.screenAt(webview_global_pos) or QApplication.screenAt(highlight_btn_pos)
         if not screen:
             window = self.window()
-            window_pos = window.mapToGlobal(window.rect().topLeft())
-            for screen_obj in QApplication.screens():
-                screen_geometry = screen_obj.geometry()
-                if screen_geometry.contains(window_pos):
-                    screen = screen_obj
-                    break
+            screen = QApplication.screenAt(window.mapToGlobal(window.rect().topLeft()))
         if not screen:
             screen = QApplication.primaryScreen()
         screen_rect = screen.availableGeometry()
@@ -1704,8 +2113,12 @@ class AIView(QWidget):
         elif dialog_y + dialog_height > screen_rect.bottom():
             dialog_y = screen_rect.bottom() - dialog_height - 10
         dialog.move(int(dialog_x), int(dialog_y))
+        self._active_highlight_dialog = dialog
         dialog.installEventFilter(self)
-        dialog.exec()
+        try:
+            dialog.exec()
+        finally:
+            self._active_highlight_dialog = None
 
     def _show_copy_success_toast(self, parent=None):
         """显示复制成功的提示信息
@@ -1768,183 +2181,174 @@ class AIView(QWidget):
             self.logger.warning("无法定位高亮位置：缺少XPath和ID")
             return
             
-        # 使用JavaScript滚动到高亮位置
-        js_code = """
-        (function() {
-            try {
-                // 尝试通过多种方式定位高亮
-                const highlightId = %d;
-                
-                // 方法1: 尝试使用高亮ID直接定位
-                const highlightElements = document.querySelectorAll('.ais-highlight');
-                let found = false;
-                
-                // 遍历所有高亮元素，查找匹配ID的高亮
-                for (const elem of highlightElements) {
-                    if (elem.dataset.highlightId === String(highlightId) || 
-                        elem.getAttribute('data-highlight-id') === String(highlightId)) {
-                        elem.scrollIntoView({ behavior: 'smooth', block: 'center' });
-                        
-                        // 闪烁动画突出显示
-                        const originalBackground = elem.style.backgroundColor;
-                        const originalTransition = elem.style.transition;
-                        
-                        elem.style.transition = 'background-color 0.5s ease';
-                        elem.style.backgroundColor = '#FF9800';
-                        
-                        setTimeout(() => {
-                            elem.style.backgroundColor = originalBackground;
-                            setTimeout(() => {
-                                elem.style.backgroundColor = '#FF9800';
-                                setTimeout(() => {
-                                    elem.style.backgroundColor = originalBackground;
-                                    elem.style.transition = originalTransition;
-                                }, 500);
-                            }, 500);
-                        }, 500);
-                        
-                        found = true;
-                        break;
-                    }
-                }
-                
-                if (found) return true;
-                
-                // 方法2: 尝试使用XPath定位
-                const xpath = "%s";
-                if (xpath) {
-                    const result = document.evaluate(xpath, document, null, 
-                                    XPathResult.FIRST_ORDERED_NODE_TYPE, null);
-                    if (result.singleNodeValue) {
-                        const elem = result.singleNodeValue;
-                        elem.scrollIntoView({ behavior: 'smooth', block: 'center' });
-                        return true;
-                    }
-                }
-                
-                // 方法3: 搜索内容
-                const content = "%s";
-                if (content) {
-                    // 使用文本内容查找节点
-                    const textNodes = [];
-                    const walker = document.createTreeWalker(
-                        document.body, 
-                        NodeFilter.SHOW_TEXT,
-                        null,
-                        false
-                    );
-                    
-                    let node;
-                    while (node = walker.nextNode()) {
-                        if (node.nodeValue.includes(content.substring(0, 50))) {
-                            textNodes.push(node);
-                        }
-                    }
-                    
-                    if (textNodes.length > 0) {
-                        textNodes[0].parentNode.scrollIntoView({ behavior: 'smooth', block: 'center' });
-                        return true;
-                    }
-                }
-                
-                return false;
-            } catch (e) {
-                console.error('定位高亮失败:', e);
-                return false;
-            }
-        })();
-        """ % (highlight_id, xpath, highlight_data.get('text_content', '')[:50].replace('"', '\\"').replace('\n', ' '))
-        
-        web_view.page().runJavaScript(js_code, lambda result: self.logger.debug(f"定位高亮结果: {result}"))
+        # 调用注入脚本中的定位函数，只传递参数，不再每次拼接整段脚本
+        content = highlight_data.get('text_content', '')[:50].replace('\n', ' ')
+        js_code = "window.AiSparkHub && window.AiSparkHub.scrollToHighlight && window.AiSparkHub.scrollToHighlight(%s, %s, %s)" % (
+            json.dumps(highlight_id), json.dumps(xpath), json.dumps(content))
+        web_view.page().runJavaScript(js_code)
 
     def eventFilter(self, obj, event):
         """事件过滤器，用于处理点击高亮弹窗外部关闭"""
-        if isinstance(obj, QDialog) and event.type() == event.Type.MouseButtonPress:
+        if obj is self._active_highlight_dialog and event.type() == event.Type.MouseButtonPress:
             # 如果点击的位置在对话框之外，关闭对话框
-            if not obj.rect().contains(event.pos()):
+            if not obj.rect().contains(event.position().toPoint()):
                 obj.close()
                 return True
         return super().eventFilter(obj, event)
 
+    @pyqtSlot()
+    def _flush_highlight_updates(self):
+        """批量更新等待中的容器的高亮计数"""
+        pending = self._pending_highlight_update
+        self._pending_highlight_update = []
+        # 跳过已经从分割器中移除的容器
+        containers = [c for c in pending if self.splitter.indexOf(c) != -1]
+        self._prefetch_highlight_counts(containers)
+        for container in containers:
+            self.update_highlight_count(container)
+    
     def update_highlight_count(self, container):
         """更新高亮按钮上显示的高亮数量
         
         Args:
             container: 包含web_view的容器
         """
-        if not hasattr(container, 'web_view') or not hasattr(container, 'highlight_btn'):
-            return
-            
         web_view = container.web_view
-        if not web_view:
+        if web_view is None or container.highlight_btn is None:
             return
             
-        current_url = web_view.url().toString()
+        current_url = web_view.current_url
         if not current_url or current_url == "about:blank":
             return
             
         # 获取当前URL的高亮数据数量
-        highlights = self.db_manager.get_highlights_for_url(current_url)
-        count = len(highlights) if highlights else 0
+        count = self._get_cached_highlight_count(current_url)
         
-        theme_colors = self.theme_manager.get_current_theme_colors() if self.theme_manager else {}
-        icon_color = theme_colors.get('foreground', '#D8DEE9')
+        icon_color = self._current_theme_colors().get('foreground', '#D8DEE9')
         
         # 更新按钮图标和工具提示
         if count > 0:
             # 创建带数字的自定义图标
-            container.highlight_btn.setIcon(qta.icon("fa5s.highlighter", color=icon_color, 
-                                                   badge=str(count), 
-                                                   badge_color='red'))
+            container.highlight_btn.setIcon(_cached_qta_icon("fa5s.highlighter", icon_color, str(count), 'red'))
             container.highlight_btn.setToolTip(f"显示页面高亮内容 ({count})")
         else:
-            container.highlight_btn.setIcon(qta.icon("fa5s.highlighter", color=icon_color))
+            container.highlight_btn.setIcon(_cached_qta_icon("fa5s.highlighter", icon_color))
             container.highlight_btn.setToolTip("显示页面高亮内容")
+    
+    def _get_cached_highlight_count(self, url):
+        """获取URL的高亮数量，有效期内直接返回缓存值
+        
+        Args:
+            url (str): 页面URL
             
-        # 定时器定期更新高亮计数
-        QTimer.singleShot(5000, lambda: self.update_highlight_count(container))
+        Returns:
+            int: 高亮数量
+        """
+        now = time.monotonic()
+        cached = self._highlight_count_cache.get(url)
+        if cached is not None and now - cached[1] < HIGHLIGHT_COUNT_TTL:
+            return cached[0]
+        count = self.db_manager.get_highlight_counts_for_urls([url]).get(url, 0)
+        self._highlight_count_cache[url] = (count, now)
+        return count
+    
+    def _prefetch_highlight_counts(self, containers):
+        """用一次数据库查询预先缓存多个容器当前页面的高亮数量
+        
+        Args:
+            containers (list): 容器列表
+        """
+        now = time.monotonic()
+        urls = set()
+        for container in containers:
+            if container.web_view is None:
+                continue
+            url = container.web_view.current_url
+            if not url or url == "about:blank":
+                continue
+            cached = self._highlight_count_cache.get(url)
+            if cached is None or now - cached[1] >= HIGHLIGHT_COUNT_TTL:
+                urls.add(url)
+        if not urls:
+            return
+        counts = self.db_manager.get_highlight_counts_for_urls(urls)
+        for url in urls:
+            self._highlight_count_cache[url] = (counts.get(url, 0), now)
+    
+    def _connect_web_view(self, web_view):
+        """连接新建网页视图的信号，URL变化或保存高亮时更新高亮计数"""
+        web_view.urlChanged.connect(self._on_web_view_url_changed)
+        web_view.highlights_changed.connect(self._on_highlights_changed)
+    
+    @pyqtSlot(QUrl)
+    def _on_web_view_url_changed(self, url):
+        """网页视图URL变化时更新所在容器的高亮计数"""
+        container = self.sender().parentWidget()
+        # 视图池中闲置的视图不属于任何容器
+        if isinstance(container, AIContainer):
+            self.update_highlight_count(container)
+    
+    @pyqtSlot(str)
+    def _on_highlights_changed(self, url):
+        """高亮数据变化时使缓存失效，并更新显示该页面的所有容器"""
+        self._highlight_count_cache.pop(url, None)
+        for i in range(self.splitter.count()):
+            container = self.splitter.widget(i)
+            if container.web_view is not None and container.web_view.current_url == url:
+                self.update_highlight_count(container)
+        
+    def _current_theme_colors(self):
+        """获取当前主题颜色，结果缓存到主题变化为止
         
+        Returns:
+            dict: 当前主题的颜色字典，没有ThemeManager时返回空字典
+        """
+        if self._theme_cache is None:
+            self._theme_cache = self.theme_manager.get_current_theme_colors() if self.theme_manager else {}
+        return self._theme_cache
+    
+    def _invalidate_theme_cache(self):
+        """主题变化时清除颜色缓存"""
+        self._theme_cache = None
+    
     def _set_initial_button_icons(self, container):
         if not self.theme_manager:
             self.logger.warning("警告: ThemeManager 未初始化，无法设置按钮图标颜色")
             # 可以设置一个默认颜色或无颜色
             icon_color = '#D8DEE9' # 默认深色前景色
         else:
-            theme_colors = self.theme_manager.get_current_theme_colors()
+            theme_colors = self._current_theme_colors()
             # 使用前景色作为图标颜色
             icon_color = theme_colors.get('foreground', '#D8DEE9') 
         
         # 获取当前高亮数量（如果是高亮按钮）
-        if hasattr(container, 'highlight_btn') and hasattr(container, 'web_view'):
-            current_url = container.web_view.url().toString()
+        if container.highlight_btn is not None:
+            current_url = container.web_view.current_url if container.web_view is not None else ""
             if current_url and current_url != "about:blank":
-                highlights = self.db_manager.get_highlights_for_url(current_url)
-                count = len(highlights) if highlights else 0
+                count = self._get_cached_highlight_count(current_url)
                 if count > 0:
-                    container.highlight_btn.setIcon(qta.icon("fa5s.highlighter", color=icon_color, 
-                                                          badge=str(count), 
-                                                          badge_color='red'))
+                    container.highlight_btn.setIcon(_cached_qta_icon("fa5s.highlighter", icon_color, str(count), 'red'))
                     container.highlight_btn.setToolTip(f"显示页面高亮内容 ({count})")
                 else:
-                    container.highlight_btn.setIcon(qta.icon("fa5s.highlighter", color=icon_color))
+                    container.highlight_btn.setIcon(_cached_qta_icon("fa5s.highlighter", icon_color))
             else:
-                container.highlight_btn.setIcon(qta.icon("fa5s.highlighter", color=icon_color))
+                container.highlight_btn.setIcon(_cached_qta_icon("fa5s.highlighter", icon_color))
                 
         # 检查按钮是否存在并设置图标
-        if hasattr(container, 'move_left_btn'):
-            container.move_left_btn.setIcon(qta.icon("fa5s.arrow-left", color=icon_color))
-        if hasattr(container, 'move_right_btn'):
-            container.move_right_btn.setIcon(qta.icon("fa5s.arrow-right", color=icon_color))
-        if hasattr(container, 'refresh_btn'):
-            container.refresh_btn.setIcon(qta.icon("fa5s.sync", color=icon_color))
-        if hasattr(container, 'maximize_btn'):
+        if container.move_left_btn is not None:
+            container.move_left_btn.setIcon(_cached_qta_icon("fa5s.arrow-left", icon_color))
+        if container.move_right_btn is not None:
+            container.move_right_btn.setIcon(_cached_qta_icon("fa5s.arrow-right", icon_color))
+        if container.refresh_btn is not None:
+            container.refresh_btn.setIcon(_cached_qta_icon("fa5s.sync", icon_color))
+        if container.maximize_btn is not None:
             # 根据当前状态设置正确的图标
             icon_name = "fa5s.compress" if container.is_maximized else "fa5s.expand"
-            container.maximize_btn.setIcon(qta.icon(icon_name, color=icon_color))
-        if hasattr(container, 'add_btn'):
-            container.add_btn.setIcon(qta.icon("fa5s.plus", color=icon_color))
-        if hasattr(container, 'close_btn'):
-            container.close_btn.setIcon(qta.icon("fa5s.times", color=icon_color))
+            container.maximize_btn.setIcon(_cached_qta_icon(icon_name, icon_color))
+        if container.add_btn is not None:
+            container.add_btn.setIcon(_cached_qta_icon("fa5s.plus", icon_color))
+        if container.close_btn is not None:
+            container.close_btn.setIcon(_cached_qta_icon("fa5s.times", icon_color))
             
     def _update_all_button_icons(self):
         if not self.theme_manager:
@@ -1952,44 +2356,46 @@ class AIView(QWidget):
             return
         
         self.logger.debug("AIView: 接收到主题变化信号，正在更新按钮图标...")
-        theme_colors = self.theme_manager.get_current_theme_colors()
+        theme_colors = self._current_theme_colors()
         icon_color = theme_colors.get('foreground', '#D8DEE9') # 获取当前主题的前景色
         self.logger.debug(f"AIView: 当前主题图标颜色: {icon_color}")
 
-        # 遍历分割器中的所有容器
-        for i in range(self.splitter.count()):
-            container = self.splitter.widget(i)
-            if container is None: # 添加检查以防万一
-                continue
+        # 先批量查询所有容器的高亮数量，下面的循环直接命中缓存
+        self._prefetch_highlight_counts([self.splitter.widget(i) for i in range(self.splitter.count())])
+
+        # 批量更新期间暂停重绘，所有图标更新完成后统一刷新一次
+        with self._batch_splitter_updates():
+            # 遍历分割器中的所有容器
+            for i in range(self.splitter.count()):
+                container = self.splitter.widget(i)
+                if container is None: # 添加检查以防万一
+                    continue
                 
-            self.logger.debug(f"AIView: 正在更新容器 {i} 的按钮图标...")
-            # 检查按钮是否存在并更新图标颜色
-            if hasattr(container, 'highlight_btn'):
-                # 更新高亮按钮时保留原有的数量显示
-                current_url = container.web_view.url().toString() if hasattr(container, 'web_view') else ""
-                highlights = self.db_manager.get_highlights_for_url(current_url) if current_url else []
-                count = len(highlights) if highlights else 0
+                self.logger.debug(f"AIView: 正在更新容器 {i} 的按钮图标...")
+                # 检查按钮是否存在并更新图标颜色
+                if container.highlight_btn is not None:
+                    # 更新高亮按钮时保留原有的数量显示
+                    current_url = container.web_view.current_url if container.web_view is not None else ""
+                    count = self._get_cached_highlight_count(current_url) if current_url else 0
                 
-                if count > 0:
-                    container.highlight_btn.setIcon(qta.icon("fa5s.highlighter", color=icon_color, 
-                                                           badge=str(count), 
-                                                           badge_color='red'))
-                else:
-                    container.highlight_btn.setIcon(qta.icon("fa5s.highlighter", color=icon_color))
-            if hasattr(container, 'move_left_btn'):
-                container.move_left_btn.setIcon(qta.icon("fa5s.arrow-left", color=icon_color))
-            if hasattr(container, 'move_right_btn'):
-                container.move_right_btn.setIcon(qta.icon("fa5s.arrow-right", color=icon_color))
-            if hasattr(container, 'refresh_btn'):
-                container.refresh_btn.setIcon(qta.icon("fa5s.sync", color=icon_color))
-            if hasattr(container, 'maximize_btn'):
-                icon_name = "fa5s.compress" if container.is_maximized else "fa5s.expand"
-                container.maximize_btn.setIcon(qta.icon(icon_name, color=icon_color))
-            if hasattr(container, 'add_btn'):
-                container.add_btn.setIcon(qta.icon("fa5s.plus", color=icon_color))
-            if hasattr(container, 'close_btn'):
-                container.close_btn.setIcon(qta.icon("fa5s.times", color=icon_color))
-            self.logger.debug(f"AIView: 容器 {i} 图标更新完成。") 
+                    if count > 0:
+                        container.highlight_btn.setIcon(_cached_qta_icon("fa5s.highlighter", icon_color, str(count), 'red'))
+                    else:
+                        container.highlight_btn.setIcon(_cached_qta_icon("fa5s.highlighter", icon_color))
+                if container.move_left_btn is not None:
+                    container.move_left_btn.setIcon(_cached_qta_icon("fa5s.arrow-left", icon_color))
+                if container.move_right_btn is not None:
+                    container.move_right_btn.setIcon(_cached_qta_icon("fa5s.arrow-right", icon_color))
+                if container.refresh_btn is not None:
+                    container.refresh_btn.setIcon(_cached_qta_icon("fa5s.sync", icon_color))
+                if container.maximize_btn is not None:
+                    icon_name = "fa5s.compress" if container.is_maximized else "fa5s.expand"
+                    container.maximize_btn.setIcon(_cached_qta_icon(icon_name, icon_color))
+                if container.add_btn is not None:
+                    container.add_btn.setIcon(_cached_qta_icon("fa5s.plus", icon_color))
+                if container.close_btn is not None:
+                    container.close_btn.setIcon(_cached_qta_icon("fa5s.times", icon_color))
+                self.logger.debug(f"AIView: 容器 {i} 图标更新完成。") 
             
     def get_visual_order_of_views(self):
         """
@@ -2006,7 +2412,7 @@ class AIView(QWidget):
         for i in range(self.splitter.count()):
             container = self.splitter.widget(i)
             # 检查容器是否有ai_key属性
-            if hasattr(container, 'ai_key'):
+            if container.ai_key is not None:
                 visual_order.append(container.ai_key)
                 self.logger.debug(f"找到视图 {container.ai_key} 位于位置 {i}")
             else:
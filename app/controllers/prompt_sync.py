@@ -144,6 +144,10 @@ class PromptSync(QObject):
                 print(f"容器可用属性: {dir(self.ai_view_container)}")
                 return False
                 
+            # 尚未显示过的视图延迟创建网页视图，发送前确保全部已创建
+            if hasattr(self.ai_view_container, 'ensure_web_views'):
+                self.ai_view_container.ensure_web_views()
+                
             # 获取活动视图
             active_views = self.ai_view_container.ai_web_views
             print(f"活动视图类型: {type(active_views)}")
@@ -160,6 +164,11 @@ class PromptSync(QObject):
             self.original_view_order = list(dict.fromkeys(active_views.keys()))  # 使用dict.fromkeys确保不重复
             print(f"记录WebView原始顺序: {self.original_view_order}")
             
+            # 提示词注入脚本只构建一次，所有视图共用
+            # （在此处导入以避免与ai_view模块循环导入）
+            from app.components.ai_view import build_inject_prompt_script
+            js_code = build_inject_prompt_script(prompt_text)
+            
             # 发送提示词到所有活动视图
             success_count = 0
             error_count = 0
@@ -169,8 +178,8 @@ class PromptSync(QObject):
                     print(f"正在发送提示词到视图 {ai_key}...")
                     
                     # 验证web_view对象
-                    if not hasattr(web_view, 'fill_prompt'):
-                        print(f"错误: 视图 {ai_key} 没有fill_prompt方法")
+                    if not hasattr(web_view, 'run_prompt_script'):
+                        print(f"错误: 视图 {ai_key} 没有run_prompt_script方法")
                         error_count += 1
                         continue
                     
@@ -179,8 +188,8 @@ class PromptSync(QObject):
                         print(f"  尝试发送到 {ai_key}，提示词长度: {len(prompt_text)}字符")
                         
                         # 使用更安全的方法发送提示词（尝试单独捕获这一步的异常）
-                        web_view.fill_prompt(prompt_text)
-                        print(f"  -> fill_prompt调用成功")
+                        web_view.run_prompt_script(js_code)
+                        print(f"  -> run_prompt_script调用成功")
                         
                         # 更新状态
                         self.pending_views.add(ai_key)
@@ -192,7 +201,7 @@ class PromptSync(QObject):
                         print(f"  -> 成功发送至 {getattr(web_view, 'ai_name', 'Unknown')} (Key: {ai_key})")
                         success_count += 1
                     except Exception as fill_err:
-                        print(f"  -> fill_prompt调用失败: {str(fill_err)}")
+                        print(f"  -> run_prompt_script调用失败: {str(fill_err)}")
                         error_count += 1
                         # 继续处理其他视图
                         continue
@@ -322,14 +322,20 @@ class ThemeManager(QObject):
                 background: #3B4252;
                 border-bottom: none;
             }
+            QWidget#aiTitleBar QPushButton {
+                color: #D8DEE9; /* 设置深色主题下图标颜色 */
+                background-color: transparent;
+                border: none;
+                padding: 2px;
+                border-radius: 3px;
+                max-width: 22px;
+                max-height: 22px;
+            }
             QWidget#aiTitleBar QPushButton:hover {
-                background-color: #4C566A;
+                background-color: rgba(120, 120, 120, 0.2);
             }
             QWidget#aiTitleBar QPushButton:pressed {
-                background-color: #5E81AC;
-            }
-            QWidget#aiTitleBar QPushButton {
-                color: #D8DEE9; /* 设置深色主题下图标颜色 */
+                background-color: rgba(100, 100, 100, 0.3);
             }
             
             /* 窗口控制按钮 */
@@ -835,14 +841,20 @@ class ThemeManager(QObject):
                 background: #E5E9F0;
                 border-bottom: none;
             }
+            QWidget#aiTitleBar QPushButton {
+                color: #3B4252; /* 设置浅色主题下图标颜色 */
+                background-color: transparent;
+                border: none;
+                padding: 2px;
+                border-radius: 3px;
+                max-width: 22px;
+                max-height: 22px;
+            }
             QWidget#aiTitleBar QPushButton:hover {
-                background-color: #D8DEE9;
+                background-color: rgba(120, 120, 120, 0.2);
             }
             QWidget#aiTitleBar QPushButton:pressed {
-                background-color: #B4C9E0; /* 浅色模式的按下颜色 */
-            }
-            QWidget#aiTitleBar QPushButton {
-                color: #3B4252; /* 设置浅色主题下图标颜色 */
+                background-color: rgba(100, 100, 100, 0.3);
             }
             
             /* 窗口控制按钮 */
@@ -11,6 +11,9 @@ import sys
 from pathlib import Path
 from PyQt6.QtWebEngineCore import QWebEngineProfile
 
+# 磁盘HTTP缓存上限，所有AI视图和浏览页面共用
+HTTP_CACHE_MAX_SIZE = 256 * 1024 * 1024
+
 class WebProfileManager:
     """Web配置文件管理器，用于管理cookies、缓存等网页数据"""
     
@@ -63,6 +66,10 @@ class WebProfileManager:
         self.profile.setPersistentStoragePath(webdata_path)
         self.profile.setCachePath(cache_path)
         
+        # 使用磁盘HTTP缓存，各AI平台共用的脚本、字体等资源可跨视图和重启复用
+        self.profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+        self.profile.setHttpCacheMaximumSize(HTTP_CACHE_MAX_SIZE)
+        
         # 启用持久化cookie存储
         self.profile.setPersistentCookiesPolicy(QWebEngineProfile.PersistentCookiesPolicy.AllowPersistentCookies)
         
@@ -2527,6 +2527,40 @@ class DatabaseManager:
             traceback.print_exc()
             return []
             
+    def get_highlight_counts_for_urls(self, urls):
+        """一次查询获取多个URL的高亮数量
+        
+        Args:
+            urls (list): 网页URL列表
+            
+        Returns:
+            dict: {url: 高亮数量}，没有高亮的URL不在结果中，失败返回空字典
+        """
+        if not self.conn:
+            print("数据库未连接")
+            return {}
+            
+        urls = list(set(urls))
+        if not urls:
+            return {}
+            
+        try:
+            cursor = self.conn.cursor()
+            placeholders = ", ".join("?" * len(urls))
+            cursor.execute(f"""
+                SELECT url, COUNT(*)
+                FROM highlight_data
+                WHERE url IN ({placeholders})
+                GROUP BY url
+            """, urls)
+            return dict(cursor.fetchall())
+            
+        except Exception as e:
+            print(f"批量获取高亮数量时出错: {e}")
+            import traceback
+            traceback.print_exc()
+            return {}
+            
     def delete_highlight(self, highlight_id):
         """删除高亮记录
         
@@ -813,6 +813,10 @@ function applyStoredHighlights(highlightDataArray) {
     showToast(`已应用 ${highlightDataArray.length} 条高亮`);
 }
 
+// 高亮ID到高亮元素的索引，在渲染高亮时建立，定位时无需遍历DOM
+window.AiSparkHub.highlightIndex = window.AiSparkHub.highlightIndex || new Map();
+window.addEventListener('pagehide', () => window.AiSparkHub.highlightIndex.clear());
+
 /**
  * 在页面中查找并高亮文本
  * @param {string} text - 要高亮的文本
@@ -860,6 +864,7 @@ function highlightTextInPage(text, style, highlightId) {
                 span.setAttribute('data-highlight-id', highlightId);
                 span.classList.add('ai-highlight');
                 span.textContent = content.substring(startIndex, startIndex + text.length);
+                window.AiSparkHub.highlightIndex.set(String(highlightId), span);
                 
                 // 分割文本节点
                 const beforeText = content.substring(0, startIndex);
@@ -910,6 +915,106 @@ function notifyHighlightApplied(highlightId) {
     }
 }
 
+/**
+ * 闪烁突出显示元素
+ * @param {Element} elem - 要突出显示的元素
+ */
+function flashHighlightElement(elem) {
+    const originalBackground = elem.style.backgroundColor;
+    const originalTransition = elem.style.transition;
+    
+    elem.style.transition = 'background-color 0.5s ease';
+    elem.style.backgroundColor = '#FF9800';
+    
+    setTimeout(() => {
+        elem.style.backgroundColor = originalBackground;
+        setTimeout(() => {
+            elem.style.backgroundColor = '#FF9800';
+            setTimeout(() => {
+                elem.style.backgroundColor = originalBackground;
+                elem.style.transition = originalTransition;
+            }, 500);
+        }, 500);
+    }, 500);
+}
+
+// 已编译的XPath表达式缓存，重复定位同一高亮时跳过解析
+window.AiSparkHub.xpathCache = window.AiSparkHub.xpathCache || new Map();
+
+/**
+ * 使用缓存的编译结果查找XPath对应的第一个节点
+ * @param {string} xpath - XPath表达式
+ * @returns {Node|null} 匹配的节点
+ */
+function evaluateXPathNode(xpath) {
+    const cache = window.AiSparkHub.xpathCache;
+    let expression = cache.get(xpath);
+    if (!expression) {
+        expression = document.createExpression(xpath, null);
+        cache.set(xpath, expression);
+    }
+    return expression.evaluate(document, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+
+/**
+ * 滚动到指定高亮位置，依次尝试高亮ID、XPath和文本内容定位
+ * @param {Number} highlightId - 高亮记录ID
+ * @param {string} xpath - 高亮所在元素的XPath
+ * @param {string} content - 高亮文本（前50个字符）
+ * @returns {boolean} 是否定位成功
+ */
+function scrollToHighlight(highlightId, xpath, content) {
+    try {
+        // 方法1: 使用高亮ID定位，优先查索引，元素已被页面移除时再查询DOM
+        if (highlightId) {
+            const key = String(highlightId);
+            const index = window.AiSparkHub.highlightIndex;
+            let elem = index.get(key);
+            if (!elem || !elem.isConnected) {
+                elem = document.querySelector(`[data-highlight-id="${CSS.escape(key)}"]`);
+                if (elem) {
+                    index.set(key, elem);
+                } else {
+                    index.delete(key);
+                }
+            }
+            if (elem) {
+                elem.scrollIntoView({ behavior: 'smooth', block: 'center' });
+                flashHighlightElement(elem);
+                return true;
+            }
+        }
+        
+        // 方法2: 使用XPath定位
+        if (xpath) {
+            const node = evaluateXPathNode(xpath);
+            if (node) {
+                node.scrollIntoView({ behavior: 'smooth', block: 'center' });
+                return true;
+            }
+        }
+        
+        // 方法3: 按文本内容查找第一个匹配的文本节点
+        if (content) {
+            const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT, null, false);
+            let node;
+            while (node = walker.nextNode()) {
+                if (node.nodeValue.includes(content)) {
+                    node.parentNode.scrollIntoView({ behavior: 'smooth', block: 'center' });
+                    return true;
+                }
+            }
+        }
+        
+        return false;
+    } catch (e) {
+        logError('定位高亮失败:', e.message);
+        return false;
+    }
+}
+
+window.AiSparkHub.scrollToHighlight = scrollToHighlight;
+
 // 简单高亮功能
 (function() {
     logInfo("======== AiSparkHub 高亮和复制功能初始化 ========");
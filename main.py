@@ -48,9 +48,9 @@ def configure_logging(data_dir):
     """配置应用程序日志系统"""
     global logger
     
-    # 创建logger
+    # 创建logger，默认只记录INFO及以上；设置环境变量 AISPARKHUB_DEBUG=1 时开启调试日志
     logger = logging.getLogger("AiSparkHub")
-    logger.setLevel(logging.DEBUG)
+    logger.setLevel(logging.DEBUG if os.environ.get("AISPARKHUB_DEBUG") else logging.INFO)
     
     # 防止重复配置
     if logger.handlers:
@@ -459,6 +459,11 @@ def main():
     logger = configure_logging(data_dir)
     logger.info(f"应用数据目录: {data_dir}")
     
+    # 跳过Qt重绘时对不透明兄弟控件的区域裁剪计算，调整分割器大小时可减少大量几何运算。
+    # 仅适用于兄弟控件互不重叠的界面：AI视图容器都位于QSplitter中，彼此不会重叠。
+    # 必须在创建QApplication之前设置
+    os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
+    
     # 创建应用实例
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)  # 关闭所有窗口时不退出应用